@@ -12,12 +12,14 @@ Features:
 - Focuses on high-threat bills first
 - Constitutional/liberty-focused AI analysis
 - Extracts what the bill ACTUALLY does vs what it claims
+- Analyzes several bills concurrently (bounded worker pool)
 
 Usage:
     python scripts/analyze_bill_text.py                    # Analyze high-priority bills
     python scripts/analyze_bill_text.py --limit 10         # Limit to 10 bills
     python scripts/analyze_bill_text.py --bill "HB 1234"   # Analyze specific bill
     python scripts/analyze_bill_text.py --test             # Test mode (no API calls)
+    python scripts/analyze_bill_text.py --refresh-cache    # Ignore cached bill text / AI responses
 
 Environment Variables:
     LEGISCAN_API_KEY: LegiScan API key for fetching bill text
@@ -26,13 +28,16 @@ Environment Variables:
 
 import argparse
 import base64
+import hashlib
 import json
 import os
 import re
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from rate_limit import RateLimiter
+
 try:
     import requests
 except ImportError:
@@ -42,6 +47,9 @@ except ImportError:
 # Paths
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
+CACHE_DIR = ROOT_DIR / ".cache"
+TEXT_CACHE_DIR = CACHE_DIR / "bill_text"  # Fetched bill text, reused across runs
+AI_CACHE_DIR = CACHE_DIR / "ai_analysis"  # AI responses keyed by hash of (model, prompt)
 
 # API Configuration
 LEGISCAN_BASE_URL = "https://api.legiscan.com/"
@@ -50,6 +58,15 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # Rate limiting
 LEGISCAN_DELAY = 2.0  # seconds between LegiScan requests
 OPENROUTER_DELAY = 3.0  # seconds between OpenRouter requests (free tier)
+AI_RETRIES = 3  # attempts per model on rate limits / 5xx / network errors
+
+# Concurrency: bills are fetched and analyzed in parallel worker threads.
+# The workers share one rate limiter per API, so adding workers overlaps
+# text fetching, parsing and AI latency without raising the request rate.
+MAX_WORKERS = 3
+
+_legiscan_limiter = RateLimiter(LEGISCAN_DELAY)
+_openrouter_limiter = RateLimiter(OPENROUTER_DELAY)
 
 # AI Models (free tier)
 AI_MODELS = [
@@ -57,6 +74,9 @@ AI_MODELS = [
     "google/gemini-2.0-flash-exp:free",
 ]
 
+# Matches any HTML/XML tag in fetched bill documents
+TAG_RE = re.compile(r'<[^>]+>')
+
 # Deep analysis prompt - constitutional watchdog perspective
 ANALYSIS_PROMPT = """You are a constitutional analyst examining Washington State legislation. Your job is to cut through legislative doublespeak and explain what bills ACTUALLY do.
 
@@ -120,11 +140,31 @@ def get_openrouter_key():
     return key
 
 
-def fetch_bill_text_legiscan(bill_id: int, api_key: str) -> str | None:
+def strip_html(html: str) -> str:
+    """Remove HTML/XML tags and collapse whitespace into single spaces."""
+    return ' '.join(TAG_RE.sub(' ', html).split())
+
+
+def read_cached_text(cache_dir: Path, name: str) -> str | None:
+    """Return cached text for a cache key, or None if not cached."""
+    cache_file = cache_dir / f"{name}.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='utf-8')
+    return None
+
+
+def write_cached_text(cache_dir: Path, name: str, text: str) -> None:
+    """Store text so later runs can skip the request that produced it."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / f"{name}.txt").write_text(text, encoding='utf-8')
+
+
+def fetch_bill_text_legiscan(bill_id: int, api_key: str, use_cache: bool = True) -> str | None:
     """Fetch bill text from LegiScan API."""
     try:
         # First get bill details to find text document ID
         params = {"key": api_key, "op": "getBill", "id": bill_id}
+        _legiscan_limiter.wait()
         response = requests.get(LEGISCAN_BASE_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
@@ -147,10 +187,16 @@ def fetch_bill_text_legiscan(bill_id: int, api_key: str) -> str | None:
         if not doc_id:
             return None
 
-        time.sleep(LEGISCAN_DELAY)
+        # Text documents are immutable per doc_id, so a cached copy is current
+        cache_key = f"legiscan-{doc_id}"
+        if use_cache:
+            cached = read_cached_text(TEXT_CACHE_DIR, cache_key)
+            if cached:
+                return cached
 
         # Fetch the actual text document
         params = {"key": api_key, "op": "getBillText", "id": doc_id}
+        _legiscan_limiter.wait()
         response = requests.get(LEGISCAN_BASE_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
@@ -166,9 +212,9 @@ def fetch_bill_text_legiscan(bill_id: int, api_key: str) -> str | None:
             try:
                 decoded = base64.b64decode(doc_content).decode('utf-8', errors='ignore')
                 # Clean up HTML/XML tags if present
-                cleaned = re.sub(r'<[^>]+>', ' ', decoded)
-                cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-                return cleaned
+                text = strip_html(decoded)
+                write_cached_text(TEXT_CACHE_DIR, cache_key, text)
+                return text
             except Exception as e:
                 print(f"    Error decoding text: {e}")
                 return None
@@ -180,7 +226,7 @@ def fetch_bill_text_legiscan(bill_id: int, api_key: str) -> str | None:
         return None
 
 
-def fetch_bill_text_wa_leg(bill_number: str) -> str | None:
+def fetch_bill_text_wa_leg(bill_number: str, use_cache: bool = True) -> str | None:
     """Fetch bill text from WA Legislature website as fallback."""
     try:
         # Parse bill number (e.g., "HB 1234" -> bill_num=1234, prefix=HB)
@@ -190,6 +236,12 @@ def fetch_bill_text_wa_leg(bill_number: str) -> str | None:
 
         prefix, num = match.groups()
 
+        cache_key = f"wa-leg-{prefix}-{num}"
+        if use_cache:
+            cached = read_cached_text(TEXT_CACHE_DIR, cache_key)
+            if cached:
+                return cached
+
         # WA Legislature URL pattern
         # https://lawfilesext.leg.wa.gov/biennium/2025-26/Htm/Bills/House%20Bills/1234.htm
         chamber = "House" if prefix.startswith("H") else "Senate"
@@ -207,10 +259,8 @@ def fetch_bill_text_wa_leg(bill_number: str) -> str | None:
         response = requests.get(url, timeout=30)
         if response.status_code == 200:
             # Parse HTML to extract text
-            html = response.text
-            # Remove HTML tags
-            text = re.sub(r'<[^>]+>', ' ', html)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = strip_html(response.text)
+            write_cached_text(TEXT_CACHE_DIR, cache_key, text)
             return text
 
         return None
@@ -220,7 +270,16 @@ def fetch_bill_text_wa_leg(bill_number: str) -> str | None:
         return None
 
 
-def analyze_with_ai(bill_number: str, title: str, bill_text: str, api_key: str) -> str | None:
+def get_retry_after(response, default: int = 60) -> int:
+    """Seconds to wait after a 429, honoring the server's Retry-After hint."""
+    try:
+        return int(response.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
+
+
+def analyze_with_ai(bill_number: str, title: str, bill_text: str, api_key: str,
+                    use_cache: bool = True) -> str | None:
     """Analyze bill text with AI."""
     # Truncate bill text if too long (keep first 60k chars for context window)
     max_text_length = 60000
@@ -241,36 +300,54 @@ def analyze_with_ai(bill_number: str, title: str, bill_text: str, api_key: str)
     }
 
     for model in AI_MODELS:
-        try:
-            payload = {
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 2000,
-                "temperature": 0.3
-            }
-
-            response = requests.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload,
-                timeout=120  # Longer timeout for long analysis
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if "choices" in data and len(data["choices"]) > 0:
-                    return data["choices"][0]["message"]["content"].strip()
-            elif response.status_code == 429:
-                print(f"    Rate limited, waiting 60s...")
-                time.sleep(60)
-                continue
-            else:
-                print(f"    AI error ({model}): {response.status_code}")
-                continue
+        cache_key = hashlib.sha256(f"{model}|{prompt}".encode('utf-8')).hexdigest()
+        if use_cache:
+            cached = read_cached_text(AI_CACHE_DIR, cache_key)
+            if cached:
+                return cached
+
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 2000,
+            "temperature": 0.3
+        }
+
+        # Retry transient failures on the same model; only fall through to
+        # the next model on terminal errors or once retries are used up
+        for attempt in range(AI_RETRIES):
+            # Backoffs below pause the shared limiter, so every worker holds
+            # off, not just the one that saw the error
+            _openrouter_limiter.wait()
+            try:
+                response = requests.post(
+                    OPENROUTER_API_URL,
+                    headers=headers,
+                    json=payload,
+                    timeout=120  # Longer timeout for long analysis
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    if "choices" in data and len(data["choices"]) > 0:
+                        analysis = data["choices"][0]["message"]["content"].strip()
+                        write_cached_text(AI_CACHE_DIR, cache_key, analysis)
+                        return analysis
+                    break
+                elif response.status_code == 429:
+                    wait = get_retry_after(response)
+                    print(f"    Rate limited, waiting {wait}s...")
+                    _openrouter_limiter.pause(wait)
+                elif response.status_code >= 500:
+                    print(f"    AI error ({model}): {response.status_code}, retrying...")
+                    _openrouter_limiter.pause(2 ** attempt)
+                else:
+                    print(f"    AI error ({model}): {response.status_code}")
+                    break
 
-        except Exception as e:
-            print(f"    AI error ({model}): {e}")
-            continue
+            except Exception as e:
+                print(f"    AI error ({model}): {e}")
+                _openrouter_limiter.pause(2 ** attempt)
 
     return None
 
@@ -291,7 +368,52 @@ def get_priority_bills(bills: list) -> list:
     return needs_analysis
 
 
-def process_bills(limit: int = None, specific_bill: str = None, test_mode: bool = False):
+def analyze_bill(bill: dict, legiscan_key: str, openrouter_key: str, test_mode: bool = False,
+                 use_cache: bool = True) -> str | None:
+    """Fetch text for a single bill and analyze it. Runs in a worker thread."""
+    bill_number = bill.get('bill_number', 'Unknown')
+    bill_id = bill.get('bill_id')
+    title = bill.get('title', '')
+
+    if test_mode:
+        # Generate test analysis
+        return f"""## WHAT IT ACTUALLY DOES
+[TEST MODE] This bill would need full text analysis to determine actual impact.
+
+## RED FLAGS
+- Unable to analyze without bill text (test mode)
+
+## WHO BENEFITS / WHO PAYS
+- Analysis requires full bill text
+
+## DECEPTION RATING
+3 - Cannot determine without text analysis
+
+## BOTTOM LINE
+[TEST] Run with API keys to get real analysis of {bill_number}."""
+
+    # Fetch bill text
+    print(f"  {bill_number}: fetching text...")
+    bill_text = None
+
+    if legiscan_key and bill_id:
+        bill_text = fetch_bill_text_legiscan(bill_id, legiscan_key, use_cache)
+
+    if not bill_text:
+        print(f"  {bill_number}: trying WA Legislature website...")
+        bill_text = fetch_bill_text_wa_leg(bill_number, use_cache)
+
+    if not bill_text:
+        print(f"  {bill_number}: could not fetch bill text, skipping")
+        return None
+
+    print(f"  {bill_number}: got {len(bill_text)} chars of text, analyzing with AI...")
+
+    return analyze_with_ai(bill_number, title, bill_text, openrouter_key, use_cache)
+
+
+def process_bills(limit: int = None, specific_bill: str = None, test_mode: bool = False,
+                  refresh_cache: bool = False):
     """Process bills and generate deep analysis."""
     bills_file = DATA_DIR / "bills.json"
 
@@ -304,6 +426,10 @@ def process_bills(limit: int = None, specific_bill: str = None, test_mode: bool
 
     print(f"Loaded {len(bills)} bills")
 
+    # Create lookups for merging results back into the main list
+    bills_by_id = {b['bill_id']: b for b in bills if b.get('bill_id')}
+    bills_by_number = {b['bill_number']: b for b in bills if b.get('bill_number')}
+
     # Get API keys
     legiscan_key = get_legiscan_key()
     openrouter_key = get_openrouter_key()
@@ -327,70 +453,43 @@ def process_bills(limit: int = None, specific_bill: str = None, test_mode: bool
         to_process = to_process[:limit]
         print(f"Limited to: {limit}")
 
-    # Process each bill
+    # Process bills concurrently; results are merged back on the main thread
     analyzed = 0
     errors = 0
 
-    for i, bill in enumerate(to_process):
-        bill_number = bill.get('bill_number', 'Unknown')
-        bill_id = bill.get('bill_id')
-        title = bill.get('title', '')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                analyze_bill, bill, legiscan_key, openrouter_key, test_mode, not refresh_cache
+            ): bill
+            for bill in to_process
+        }
 
-        print(f"\n[{i+1}/{len(to_process)}] Analyzing {bill_number}...")
-        print(f"  Title: {title[:60]}...")
-        print(f"  Threat: {bill.get('threat_level', 'unknown')}")
-
-        if test_mode:
-            # Generate test analysis
-            analysis = f"""## WHAT IT ACTUALLY DOES
-[TEST MODE] This bill would need full text analysis to determine actual impact.
+        for i, future in enumerate(as_completed(futures)):
+            bill = futures[future]
+            bill_number = bill.get('bill_number', 'Unknown')
+            bill_id = bill.get('bill_id')
 
-## RED FLAGS
-- Unable to analyze without bill text (test mode)
+            print(f"\n[{i+1}/{len(to_process)}] {bill_number}")
+            print(f"  Title: {bill.get('title', '')[:60]}...")
+            print(f"  Threat: {bill.get('threat_level', 'unknown')}")
 
-## WHO BENEFITS / WHO PAYS
-- Analysis requires full bill text
-
-## DECEPTION RATING
-3 - Cannot determine without text analysis
-
-## BOTTOM LINE
-[TEST] Run with API keys to get real analysis of {bill_number}."""
-        else:
-            # Fetch bill text
-            print(f"  Fetching text...")
-            bill_text = None
-
-            if legiscan_key and bill_id:
-                bill_text = fetch_bill_text_legiscan(bill_id, legiscan_key)
-                time.sleep(LEGISCAN_DELAY)
-
-            if not bill_text:
-                print(f"  Trying WA Legislature website...")
-                bill_text = fetch_bill_text_wa_leg(bill_number)
-
-            if not bill_text:
-                print(f"  Could not fetch bill text, skipping")
+            try:
+                analysis = future.result()
+            except Exception as e:
+                print(f"  Unexpected error: {e}")
+                analysis = None
+
+            if analysis:
+                # Update bill in main list
+                target = bills_by_id.get(bill_id) or bills_by_number.get(bill_number)
+                if target:
+                    target['bill_analysis'] = analysis
+                analyzed += 1
+                print(f"  Analysis complete ({len(analysis)} chars)")
+            else:
                 errors += 1
-                continue
-
-            print(f"  Got {len(bill_text)} chars of text")
-            print(f"  Analyzing with AI...")
-
-            analysis = analyze_with_ai(bill_number, title, bill_text, openrouter_key)
-            time.sleep(OPENROUTER_DELAY)
-
-        if analysis:
-            # Update bill in main list
-            for b in bills:
-                if b.get('bill_id') == bill_id or b.get('bill_number') == bill_number:
-                    b['bill_analysis'] = analysis
-                    break
-            analyzed += 1
-            print(f"  Analysis complete ({len(analysis)} chars)")
-        else:
-            errors += 1
-            print(f"  Analysis failed")
+                print(f"  Analysis failed")
 
     # Save updated bills
     with open(bills_file, 'w', encoding='utf-8') as f:
@@ -410,13 +509,15 @@ def main():
     parser.add_argument("--limit", type=int, help="Maximum bills to analyze")
     parser.add_argument("--bill", type=str, help="Analyze specific bill (e.g., 'HB 1234')")
     parser.add_argument("--test", action="store_true", help="Test mode (no API calls)")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached bill text and AI responses")
 
     args = parser.parse_args()
 
     return process_bills(
         limit=args.limit,
         specific_bill=args.bill,
-        test_mode=args.test
+        test_mode=args.test,
+        refresh_cache=args.refresh_cache
     )
 
 
@@ -5,6 +5,7 @@ Exposes how legislators abuse session rules by introducing massive numbers of bi
 at once, making public scrutiny practically impossible.
 """
 
+import heapq
 import json
 from pathlib import Path
 from collections import defaultdict
@@ -37,6 +38,8 @@ def analyze_flooding():
 
     harmful_levels = {'critical', 'high'}
 
+    # Count bills per raw date string first; each distinct date is then
+    # parsed once when rolling days up into months and years
     for bill in bills:
         # Try different date fields
         date_str = (
@@ -45,44 +48,46 @@ def analyze_flooding():
             ''
         )
 
-        if not date_str or date_str == '':
+        if not date_str:
             continue
 
+        day = by_date[date_str]
+        day['total'] += 1
+        day['bills'].append(bill.get('bill_number'))
+        if bill.get('threat_level') in harmful_levels:
+            day['harmful'] += 1
+
+    for date_str in list(by_date):
         try:
             date = datetime.strptime(date_str, '%Y-%m-%d')
-            date_key = date_str
-            month_key = date.strftime('%Y-%m')
-            year_key = str(date.year)
-
-            is_harmful = bill.get('threat_level') in harmful_levels
+        except ValueError:
+            del by_date[date_str]
+            continue
 
-            by_date[date_key]['total'] += 1
-            by_date[date_key]['bills'].append(bill.get('bill_number'))
-            if is_harmful:
-                by_date[date_key]['harmful'] += 1
+        data = by_date[date_str]
+        month_key = date.strftime('%Y-%m')
+        year_key = str(date.year)
 
-            by_month[month_key]['total'] += 1
-            if is_harmful:
-                by_month[month_key]['harmful'] += 1
+        by_month[month_key]['total'] += data['total']
+        by_month[month_key]['harmful'] += data['harmful']
 
-            by_year[year_key]['total'] += 1
-            if is_harmful:
-                by_year[year_key]['harmful'] += 1
-
-        except ValueError:
-            continue
+        by_year[year_key]['total'] += data['total']
+        by_year[year_key]['harmful'] += data['harmful']
 
     # Find worst flooding days (threshold: 50+ bills)
     FLOOD_THRESHOLD = 50
-    flood_days = []
-    for date_str, data in sorted(by_date.items(), key=lambda x: -x[1]['total']):
-        if data['total'] >= FLOOD_THRESHOLD:
-            flood_days.append({
-                'date': date_str,
-                'total': data['total'],
-                'harmful': data['harmful'],
-                'sample_bills': data['bills'][:10]
-            })
+    flood_days = [
+        {
+            'date': date_str,
+            'total': data['total'],
+            'harmful': data['harmful'],
+            'sample_bills': data['bills'][:10]
+        }
+        for date_str, data in by_date.items()
+        if data['total'] >= FLOOD_THRESHOLD
+    ]
+    # Only the (few) flood days need ordering, worst first
+    flood_days.sort(key=lambda x: -x['total'])
 
     # Calculate statistics
     total_bills = len(bills)
@@ -161,7 +166,7 @@ def analyze_flooding():
     print()
     print("MONTHLY BREAKDOWN:")
     print("-" * 40)
-    for month in sorted(monthly_data, key=lambda x: -x['total'])[:12]:
+    for month in heapq.nlargest(12, monthly_data, key=lambda x: x['total']):
         print(f"  {month['month']}: {month['total']} bills ({month['harmful']} harmful)")
 
     print()
@@ -12,6 +12,16 @@ from datetime import datetime
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
 
+# History actions that indicate an amendment, combined into one alternation
+# so each action is scanned once
+AMENDMENT_RE = re.compile('|'.join([
+    r'amended',
+    r'substitute',
+    r'striking amendment',
+    r'engrossed',
+    r'floor amendment'
+]))
+
 
 def detect_amendments():
     """Detect and mark amended bills."""
@@ -39,41 +49,30 @@ def detect_amendments():
         'history': 0
     }
 
-    amendment_patterns = [
-        r'amended',
-        r'substitute',
-        r'striking amendment',
-        r'engrossed',
-        r'floor amendment'
-    ]
-
     for bill in bills:
         amended = False
-        amendment_count = 0
 
         # Check status for "Engrossed"
-        status = bill.get('status', '').lower()
+        status = (bill.get('status') or '').lower()
         if 'engrossed' in status:
             amended = True
             detection_types['engrossed'] += 1
 
         # Check title for "substitute"
-        title = bill.get('title', '').lower()
+        title = (bill.get('title') or '').lower()
         if 'substitute' in title:
             amended = True
             detection_types['substitute'] += 1
 
-        # Check history for amendment actions
+        # Check history for amendment actions (one per matching event)
         history = bill.get('history', [])
-        for event in history:
-            action = event.get('action', '').lower()
-            for pattern in amendment_patterns:
-                if re.search(pattern, action):
-                    amendment_count += 1
-                    if not amended:
-                        amended = True
-                        detection_types['history'] += 1
-                    break
+        amendment_count = sum(
+            1 for event in history
+            if AMENDMENT_RE.search(event.get('action', '').lower())
+        )
+        if amendment_count and not amended:
+            amended = True
+            detection_types['history'] += 1
 
         if amended:
             bill['amended'] = True
@@ -53,45 +53,96 @@ HIGH_MAGNITUDE = [r'billion', r'\$\d{3,}.*million', r'major', r'comprehensive',
 MEDIUM_MAGNITUDE = [r'million', r'\$\d{1,2}.*million', r'significant']
 
 
-def categorize_bill(bill: dict) -> dict | None:
-    """Categorize a bill's fiscal impact."""
+# Pattern shapes that can be matched without the regex engine:
+# r'\btax\b' is a whole word, r'\bappropriat' a word prefix, and
+# r'tax relief' a plain substring
+WHOLE_WORD_RE = re.compile(r'\\b(\w+)\\b')
+WORD_PREFIX_RE = re.compile(r'\\b(\w+)')
+LITERAL_RE = re.compile(r'[\w ]+')
+
+
+def compile_alternation(patterns: list) -> re.Pattern | None:
+    """Join patterns into a single alternation regex so text is scanned once."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+def build_matcher(patterns: list) -> tuple:
+    """Split patterns into (words, word prefixes, substrings, regex).
+
+    Plain keywords are checked with set membership / str methods; only
+    patterns that really need the regex engine go into the alternation.
+    """
+    words, prefixes, substrings, regexes = set(), [], [], []
+    for pattern in patterns:
+        if match := WHOLE_WORD_RE.fullmatch(pattern):
+            words.add(match.group(1))
+        elif match := WORD_PREFIX_RE.fullmatch(pattern):
+            prefixes.append(match.group(1))
+        elif LITERAL_RE.fullmatch(pattern):
+            substrings.append(pattern)
+        else:
+            regexes.append(pattern)
+    return frozenset(words), tuple(prefixes), tuple(substrings), compile_alternation(regexes)
+
+
+def matches(matcher: tuple, text: str, words: set) -> bool:
+    """Check whether any pattern of a matcher occurs in the bill text."""
+    whole_words, prefixes, substrings, regex = matcher
+    return (
+        not whole_words.isdisjoint(words)
+        or (bool(prefixes) and any(word.startswith(prefixes) for word in words))
+        or any(substring in text for substring in substrings)
+        or (regex is not None and regex.search(text) is not None)
+    )
+
+
+# HTML entities occasionally left in descriptions / AI summaries
+ENTITY_RE = re.compile(r'&[a-z]+;|&#\d+;')
+WORD_RE = re.compile(r'\w+')
+
+# One matcher per category / magnitude, built once at module load
+INCLUDE = {cat: build_matcher(cfg['patterns']) for cat, cfg in CATEGORIES.items()}
+EXCLUDE = {cat: build_matcher(cfg['exclude']) for cat, cfg in CATEGORIES.items()}
+HIGH_MAGNITUDE_MATCHER = build_matcher(HIGH_MAGNITUDE)
+MEDIUM_MAGNITUDE_MATCHER = build_matcher(MEDIUM_MAGNITUDE)
+
+
+def preprocess(bill: dict) -> str:
+    """Build the lowercased, whitespace-normalized text matched for a bill."""
     text = ' '.join([
         bill.get('title', ''),
         bill.get('ai_summary', ''),
         bill.get('description', ''),
         ' '.join(bill.get('concerns', []))
     ]).lower()
+    return ' '.join(ENTITY_RE.sub(' ', text).split())
 
-    for category, config in CATEGORIES.items():
-        # Check exclusions first
-        excluded = False
-        for pattern in config['exclude']:
-            if re.search(pattern, text):
-                excluded = True
-                break
 
-        if excluded:
+def categorize_bill(text: str) -> dict | None:
+    """Categorize a bill's fiscal impact from its preprocessed text."""
+    words = set(WORD_RE.findall(text))
+
+    for category in CATEGORIES:
+        # Check exclusions first
+        if matches(EXCLUDE[category], text, words):
             continue
 
         # Check for matches
-        for pattern in config['patterns']:
-            if re.search(pattern, text):
-                # Determine magnitude
+        if matches(INCLUDE[category], text, words):
+            # Determine magnitude
+            if matches(HIGH_MAGNITUDE_MATCHER, text, words):
+                magnitude = 'High'
+            elif matches(MEDIUM_MAGNITUDE_MATCHER, text, words):
+                magnitude = 'Medium'
+            else:
                 magnitude = 'Low'
-                for high_pattern in HIGH_MAGNITUDE:
-                    if re.search(high_pattern, text):
-                        magnitude = 'High'
-                        break
-                if magnitude != 'High':
-                    for med_pattern in MEDIUM_MAGNITUDE:
-                        if re.search(med_pattern, text):
-                            magnitude = 'Medium'
-                            break
-
-                return {
-                    'category': category,
-                    'magnitude': magnitude
-                }
+
+            return {
+                'category': category,
+                'magnitude': magnitude
+            }
 
     return None
 
@@ -113,19 +164,21 @@ def extract_fiscal_impact():
     magnitude_counts = {'High': 0, 'Medium': 0, 'Low': 0}
 
     for bill in bills:
-        result = categorize_bill(bill)
+        result = categorize_bill(preprocess(bill))
         if result:
+            category = result['category']
+            magnitude = result['magnitude']
             fiscal_bills.append({
                 'bill_id': bill.get('bill_id'),
                 'bill_number': bill.get('bill_number'),
                 'title': bill.get('title'),
-                'category': result['category'],
-                'magnitude': result['magnitude'],
+                'category': category,
+                'magnitude': magnitude,
                 'threat_level': bill.get('threat_level'),
                 'ai_summary': bill.get('ai_summary', '')[:200]
             })
-            category_counts[result['category']] += 1
-            magnitude_counts[result['magnitude']] += 1
+            category_counts[category] += 1
+            magnitude_counts[magnitude] += 1
 
     # Sort by magnitude (High first) then by category
     magnitude_order = {'High': 0, 'Medium': 1, 'Low': 2}
@@ -18,11 +18,13 @@ import argparse
 import json
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from rate_limit import RateLimiter
+
 try:
     import requests
 except ImportError:
@@ -36,10 +38,70 @@ WA_STATE_ID = 48  # Washington State
 CURRENT_SESSION_YEAR = 2025
 DATA_DIR = Path(__file__).parent.parent / "_data"
 
+# Bill number prefixes by chamber
+HOUSE_PREFIXES = ("HB", "HJR", "HCR", "HR")
+SENATE_PREFIXES = ("SB", "SJR", "SCR", "SR")
+BILL_PREFIXES = ("HB", "SB", "HJR", "SJR", "HCR", "SCR", "HR", "SR")  # Match order for formatting
+
 # Rate limiting
 REQUESTS_PER_MINUTE = 30
 REQUEST_DELAY = 60.0 / REQUESTS_PER_MINUTE
 
+# Detail fetches run in parallel threads; they share one rate limiter, so
+# this only overlaps network latency and never exceeds REQUESTS_PER_MINUTE
+DETAIL_WORKERS = 4
+
+_rate_limiter = RateLimiter(REQUEST_DELAY)
+
+# One pooled session so the detail fetches reuse TCP/TLS connections
+# (requests already asks for gzip/deflate responses)
+_http = requests.Session()
+
+# Smart quotes and dashes in LegiScan descriptions, mapped to ASCII
+SMART_PUNCTUATION = str.maketrans({
+    '\u2018': "'", '\u2019': "'",
+    '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-',
+})
+
+# Fields added by the scoring/AI scripts, kept across fetches (in output order)
+PRESERVED_KEYS = (
+    "threat_score", "threat_level", "threat_label", "concerns",
+    "positives", "ai_summary", "plain_summary", "amended",
+    "amendment_count", "related_bills", "fiscal_impact", "bill_analysis",
+)
+
+# LegiScan status codes
+# https://legiscan.com/misc/LegiScan_API_User_Manual.pdf
+STATUS_CODES = {
+    0: "N/A",
+    1: "Introduced",
+    2: "Engrossed",
+    3: "Enrolled",
+    4: "Passed",
+    5: "Vetoed",
+    6: "Failed",
+    # Additional common statuses we may see as text
+}
+
+# Text statuses as (substring, display value), checked in order
+STATUS_MAP = (
+    ("introduced", "Introduced"),
+    ("prefiled", "Prefiled"),
+    ("in committee", "In Committee"),
+    ("passed committee", "Passed Committee"),
+    ("passed house", "Passed House"),
+    ("passed senate", "Passed Senate"),
+    ("passed", "Passed"),
+    ("signed", "Signed"),
+    ("enacted", "Enacted"),
+    ("vetoed", "Vetoed"),
+    ("dead", "Dead"),
+    ("failed", "Failed"),
+    ("engrossed", "Engrossed"),
+    ("enrolled", "Enrolled"),
+)
+
 
 def get_api_key() -> str:
     """Get the LegiScan API key from environment variable."""
@@ -57,7 +119,10 @@ def make_api_request(operation: str, params: dict[str, Any], api_key: str) -> di
     params["key"] = api_key
     params["op"] = operation
 
-    response = requests.get(LEGISCAN_BASE_URL, params=params, timeout=30)
+    # Rate limiting
+    _rate_limiter.wait()
+
+    response = _http.get(LEGISCAN_BASE_URL, params=params, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -65,9 +130,6 @@ def make_api_request(operation: str, params: dict[str, Any], api_key: str) -> di
     if data.get("status") == "ERROR":
         raise RuntimeError(f"LegiScan API error: {data.get('alert', {}).get('message', 'Unknown error')}")
 
-    # Rate limiting
-    time.sleep(REQUEST_DELAY)
-
     return data
 
 
@@ -116,45 +178,15 @@ def normalize_status(status_input) -> str:
 
     LegiScan returns status as an integer code. Map it to human-readable text.
     """
-    # LegiScan status codes
-    # https://legiscan.com/misc/LegiScan_API_User_Manual.pdf
-    status_codes = {
-        0: "N/A",
-        1: "Introduced",
-        2: "Engrossed",
-        3: "Enrolled",
-        4: "Passed",
-        5: "Vetoed",
-        6: "Failed",
-        # Additional common statuses we may see as text
-    }
-
     # Handle integer status codes
     if isinstance(status_input, int):
-        return status_codes.get(status_input, f"Status {status_input}")
+        return STATUS_CODES.get(status_input, f"Status {status_input}")
 
     # Handle string status
     status_text = str(status_input) if status_input else "Unknown"
     status_lower = status_text.lower()
 
-    status_map = {
-        "introduced": "Introduced",
-        "prefiled": "Prefiled",
-        "in committee": "In Committee",
-        "passed committee": "Passed Committee",
-        "passed house": "Passed House",
-        "passed senate": "Passed Senate",
-        "passed": "Passed",
-        "signed": "Signed",
-        "enacted": "Enacted",
-        "vetoed": "Vetoed",
-        "dead": "Dead",
-        "failed": "Failed",
-        "engrossed": "Engrossed",
-        "enrolled": "Enrolled",
-    }
-
-    for key, value in status_map.items():
+    for key, value in STATUS_MAP:
         if key in status_lower:
             return value
 
@@ -164,9 +196,9 @@ def normalize_status(status_input) -> str:
 def determine_chamber(bill_number: str) -> str:
     """Determine chamber based on bill number prefix."""
     bill_upper = bill_number.upper()
-    if bill_upper.startswith(("HB", "HJR", "HCR", "HR")):
+    if bill_upper.startswith(HOUSE_PREFIXES):
         return "House"
-    elif bill_upper.startswith(("SB", "SJR", "SCR", "SR")):
+    elif bill_upper.startswith(SENATE_PREFIXES):
         return "Senate"
     return "Unknown"
 
@@ -174,12 +206,23 @@ def determine_chamber(bill_number: str) -> str:
 def format_bill_number(bill_number: str) -> str:
     """Format bill number consistently (e.g., 'HB 1234')."""
     # Insert space if not present
-    for prefix in ["HB", "SB", "HJR", "SJR", "HCR", "SCR", "HR", "SR"]:
-        if bill_number.upper().startswith(prefix) and not bill_number.startswith(f"{prefix} "):
+    bill_upper = bill_number.upper()
+    for prefix in BILL_PREFIXES:
+        if bill_upper.startswith(prefix) and not bill_number.startswith(f"{prefix} "):
             return f"{prefix} {bill_number[len(prefix):]}"
     return bill_number
 
 
+def clean_text(value: Any) -> Any:
+    """Drop anything that can't be encoded as UTF-8 (e.g. lone surrogates).
+
+    Non-string values (None, numbers) pass through untouched.
+    """
+    if isinstance(value, str):
+        return value.encode('utf-8', errors='ignore').decode('utf-8')
+    return value
+
+
 def transform_bill_data(master_bill: dict, detail_bill: dict | None) -> dict:
     """Transform API data into the format needed for the site."""
     bill_number = format_bill_number(master_bill.get("number", ""))
@@ -188,14 +231,14 @@ def transform_bill_data(master_bill: dict, detail_bill: dict | None) -> dict:
     bill = {
         "bill_id": master_bill.get("bill_id"),
         "bill_number": bill_number,
-        "title": master_bill.get("title", ""),
+        "title": clean_text(master_bill.get("title", "")),
         "description": "",
-        "status": normalize_status(master_bill.get("status", "Unknown")),
+        "status": clean_text(normalize_status(master_bill.get("status", "Unknown"))),
         "chamber": determine_chamber(bill_number),
         "sponsors": [],
         "introduced_date": "",
-        "last_action": master_bill.get("last_action", ""),
-        "last_action_date": master_bill.get("last_action_date", ""),
+        "last_action": clean_text(master_bill.get("last_action", "")),
+        "last_action_date": clean_text(master_bill.get("last_action_date", "")),
         "history": [],
         "official_url": f"https://app.leg.wa.gov/billsummary?BillNumber={bill_number.split()[-1]}&Year={CURRENT_SESSION_YEAR}",
     }
@@ -205,37 +248,43 @@ def transform_bill_data(master_bill: dict, detail_bill: dict | None) -> dict:
         # Clean description of problematic characters
         desc = detail_bill.get("description", "") or ""
         # Replace smart quotes and other problematic chars with ASCII equivalents
-        desc = desc.replace('\u2019', "'").replace('\u2018', "'")
-        desc = desc.replace('\u201c', '"').replace('\u201d', '"')
-        desc = desc.replace('\u2013', '-').replace('\u2014', '-')
-        desc = desc.encode('utf-8', errors='ignore').decode('utf-8')
-        bill["description"] = desc
+        desc = desc.translate(SMART_PUNCTUATION)
+        bill["description"] = clean_text(desc)
 
         # Sponsors
         sponsors = detail_bill.get("sponsors", [])
         bill["sponsors"] = [
-            s.get("name", "") for s in sponsors if s.get("name")
+            clean_text(s.get("name", "")) for s in sponsors if s.get("name")
         ]
 
         # Committee
         committee = detail_bill.get("committee", {})
         if committee:
-            bill["committee"] = committee.get("name", "")
+            bill["committee"] = clean_text(committee.get("name", ""))
 
         # History
         history = detail_bill.get("history", [])
         bill["history"] = [
-            {"date": h.get("date", ""), "action": h.get("action", "")}
+            {"date": clean_text(h.get("date", "")), "action": clean_text(h.get("action", ""))}
             for h in history[-10:]  # Last 10 actions
         ]
 
         # Introduced date (first history entry)
         if history:
-            bill["introduced_date"] = history[0].get("date", "")
+            bill["introduced_date"] = clean_text(history[0].get("date", ""))
 
     return bill
 
 
+def apply_existing_data(bill: dict, existing: dict) -> None:
+    """Carry detail, scoring and AI fields over from the cached bill."""
+    bill["description"] = existing.get("description", "")
+    bill["sponsors"] = existing.get("sponsors", [])
+    bill["history"] = existing.get("history", [])
+    bill["introduced_date"] = existing.get("introduced_date", "")
+    bill.update({key: existing[key] for key in PRESERVED_KEYS if key in existing})
+
+
 def load_existing_bills() -> dict[int, dict]:
     """Load existing bills.json and return a lookup by bill_id."""
     bills_file = DATA_DIR / "bills.json"
@@ -281,74 +330,53 @@ def fetch_all_bills(api_key: str, limit: int | None = None, fetch_details: bool
     existing_bills = load_existing_bills()
     print(f"Found {len(existing_bills)} existing bills in cache")
 
-    # Count how many need details
-    needs_detail_count = sum(
-        1 for b in master_bills
-        if b.get("bill_id") not in existing_bills or not existing_bills.get(b.get("bill_id"), {}).get("description")
-    )
+    # One pass over the master list: count bills missing a description and
+    # decide which get a detail fetch (the limit applies to these only)
+    needs_detail_count = 0
+    to_fetch = []
+    for master_bill in master_bills:
+        existing = existing_bills.get(master_bill.get("bill_id"))
+
+        # New bill, or existing bill but missing description
+        missing_description = existing is None or not existing.get("description")
+        needs_detail_count += missing_description
+
+        if (fetch_details or missing_description) and not (limit and len(to_fetch) >= limit):
+            to_fetch.append(master_bill)
+
     print(f"Bills needing description fetch: {needs_detail_count}")
 
     if limit:
         # Limit only applies to bills needing details, not total
         print(f"Limiting detail fetches to {limit} bills")
 
-    bills = []
-    total = len(master_bills)
-    details_fetched = 0
+    # Fetch details in parallel, bounded by the shared rate limiter
+    details = {}
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+        futures = {
+            executor.submit(get_bill_details, master_bill.get("bill_id"), api_key): master_bill
+            for master_bill in to_fetch
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            master_bill = futures[future]
+            details[master_bill.get("bill_id")] = future.result()
+            print(f"  [{i}/{len(to_fetch)}] Fetched {master_bill.get('number', 'Unknown')}")
 
-    for i, master_bill in enumerate(master_bills, 1):
-        bill_id = master_bill.get("bill_id")
-        bill_number = master_bill.get("number", "Unknown")
+    details_fetched = len(details)
 
+    bills = []
+    for master_bill in master_bills:
+        bill_id = master_bill.get("bill_id")
         existing = existing_bills.get(bill_id)
 
-        # Check if we need to fetch details for this bill
-        needs_details = False
-        if fetch_details:
-            needs_details = True
-        elif existing is None:
-            # New bill - fetch details
-            needs_details = True
-        elif not existing.get("description"):
-            # Existing bill but missing description
-            needs_details = True
-
-        if needs_details:
-            # Check if we've hit the limit for detail fetches
-            if limit and details_fetched >= limit:
-                # Skip fetching, use existing data if available
-                bill_data = transform_bill_data(master_bill, None)
-                if existing:
-                    bill_data["description"] = existing.get("description", "")
-                    bill_data["sponsors"] = existing.get("sponsors", [])
-                    bill_data["history"] = existing.get("history", [])
-                    bill_data["introduced_date"] = existing.get("introduced_date", "")
-                    for key in ["threat_score", "threat_level", "threat_label", "concerns",
-                               "positives", "ai_summary", "plain_summary", "amended",
-                               "amendment_count", "related_bills", "fiscal_impact", "bill_analysis"]:
-                        if key in existing:
-                            bill_data[key] = existing[key]
-            else:
-                print(f"  [{details_fetched + 1}/{needs_detail_count if not limit else min(limit, needs_detail_count)}] Fetching {bill_number}...", end="", flush=True)
-                detail_bill = get_bill_details(bill_id, api_key)
-                bill_data = transform_bill_data(master_bill, detail_bill)
-                details_fetched += 1
-                print(" done")
+        if bill_id in details:
+            bill_data = transform_bill_data(master_bill, details[bill_id])
         else:
-            # Use existing data, just update from master list
+            # Not fetched this run (already cached, or over the detail
+            # limit): update from master list and keep existing data
             bill_data = transform_bill_data(master_bill, None)
-            # Preserve existing description, sponsors, history, ai_summary, scores
             if existing:
-                bill_data["description"] = existing.get("description", "")
-                bill_data["sponsors"] = existing.get("sponsors", [])
-                bill_data["history"] = existing.get("history", [])
-                bill_data["introduced_date"] = existing.get("introduced_date", "")
-                # Preserve scoring and AI data
-                for key in ["threat_score", "threat_level", "threat_label", "concerns",
-                           "positives", "ai_summary", "plain_summary", "amended",
-                           "amendment_count", "related_bills", "fiscal_impact"]:
-                    if key in existing:
-                        bill_data[key] = existing[key]
+                apply_existing_data(bill_data, existing)
 
         bills.append(bill_data)
 
@@ -356,107 +384,111 @@ def fetch_all_bills(api_key: str, limit: int | None = None, fetch_details: bool
     return bills
 
 
+# Sample bills for --test runs (no API key needed)
+SAMPLE_BILLS = [
+    {
+        "bill_id": 1001,
+        "bill_number": "HB 1234",
+        "title": "Concerning digital privacy protections for consumers",
+        "description": "An act relating to establishing comprehensive digital privacy rights for Washington residents, including data collection transparency requirements and consumer opt-out provisions.",
+        "status": "In Committee",
+        "chamber": "House",
+        "sponsors": ["Rep. Smith", "Rep. Johnson"],
+        "introduced_date": "2025-01-13",
+        "last_action": "Referred to Innovation, Community & Economic Development, & Veterans.",
+        "last_action_date": "2025-01-15",
+        "committee": "Innovation, Community & Economic Development, & Veterans",
+        "history": [
+            {"date": "2025-01-13", "action": "First reading, referred to Innovation, Community & Economic Development, & Veterans."},
+            {"date": "2025-01-15", "action": "Scheduled for public hearing in committee."}
+        ],
+        "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=1234&Year=2025",
+    },
+    {
+        "bill_id": 1002,
+        "bill_number": "SB 5678",
+        "title": "Establishing a statewide housing affordability program",
+        "description": "An act relating to creating a comprehensive housing affordability initiative, including incentives for affordable housing development and tenant protection measures.",
+        "status": "Passed Senate",
+        "chamber": "Senate",
+        "sponsors": ["Sen. Williams", "Sen. Davis", "Sen. Martinez"],
+        "introduced_date": "2025-01-10",
+        "last_action": "Third reading, passed; yeas, 35; nays, 14.",
+        "last_action_date": "2025-02-01",
+        "committee": "Housing",
+        "history": [
+            {"date": "2025-01-10", "action": "First reading, referred to Housing."},
+            {"date": "2025-01-18", "action": "Public hearing in the Senate Committee on Housing."},
+            {"date": "2025-01-25", "action": "Executive action taken in the Senate Committee on Housing."},
+            {"date": "2025-02-01", "action": "Third reading, passed; yeas, 35; nays, 14."}
+        ],
+        "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=5678&Year=2025",
+    },
+    {
+        "bill_id": 1003,
+        "bill_number": "HB 2001",
+        "title": "Concerning environmental protection standards",
+        "description": "An act relating to strengthening environmental protection standards for industrial facilities, including emission reporting requirements and compliance enforcement.",
+        "status": "Introduced",
+        "chamber": "House",
+        "sponsors": ["Rep. Chen"],
+        "introduced_date": "2025-01-20",
+        "last_action": "First reading, referred to Environment & Energy.",
+        "last_action_date": "2025-01-20",
+        "committee": "Environment & Energy",
+        "history": [
+            {"date": "2025-01-20", "action": "First reading, referred to Environment & Energy."}
+        ],
+        "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=2001&Year=2025",
+    },
+    {
+        "bill_id": 1004,
+        "bill_number": "SB 5100",
+        "title": "Relating to public education funding",
+        "description": "An act relating to increasing state funding for K-12 public education, including provisions for teacher compensation and classroom resources.",
+        "status": "In Committee",
+        "chamber": "Senate",
+        "sponsors": ["Sen. Thompson", "Sen. Anderson"],
+        "introduced_date": "2025-01-12",
+        "last_action": "Public hearing scheduled for February 5.",
+        "last_action_date": "2025-01-28",
+        "committee": "Early Learning & K-12 Education",
+        "history": [
+            {"date": "2025-01-12", "action": "First reading, referred to Early Learning & K-12 Education."},
+            {"date": "2025-01-20", "action": "Scheduled for public hearing."},
+            {"date": "2025-01-28", "action": "Public hearing scheduled for February 5."}
+        ],
+        "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=5100&Year=2025",
+    },
+    {
+        "bill_id": 1005,
+        "bill_number": "HB 1500",
+        "title": "Establishing healthcare price transparency requirements",
+        "description": "An act relating to requiring healthcare providers and insurers to publish pricing information for common procedures and services.",
+        "status": "Passed Committee",
+        "chamber": "House",
+        "sponsors": ["Rep. Garcia", "Rep. Lee", "Rep. Patel"],
+        "introduced_date": "2025-01-11",
+        "last_action": "Executive action taken; reported out of committee as substitute.",
+        "last_action_date": "2025-01-30",
+        "committee": "Health Care & Wellness",
+        "history": [
+            {"date": "2025-01-11", "action": "First reading, referred to Health Care & Wellness."},
+            {"date": "2025-01-22", "action": "Public hearing in committee."},
+            {"date": "2025-01-30", "action": "Executive action taken; reported out of committee as substitute."}
+        ],
+        "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=1500&Year=2025",
+    },
+]
+
+
 def generate_sample_data() -> list[dict]:
     """Generate sample bill data for testing without API."""
     print("Generating sample bill data for testing...")
 
-    sample_bills = [
-        {
-            "bill_id": 1001,
-            "bill_number": "HB 1234",
-            "title": "Concerning digital privacy protections for consumers",
-            "description": "An act relating to establishing comprehensive digital privacy rights for Washington residents, including data collection transparency requirements and consumer opt-out provisions.",
-            "status": "In Committee",
-            "chamber": "House",
-            "sponsors": ["Rep. Smith", "Rep. Johnson"],
-            "introduced_date": "2025-01-13",
-            "last_action": "Referred to Innovation, Community & Economic Development, & Veterans.",
-            "last_action_date": "2025-01-15",
-            "committee": "Innovation, Community & Economic Development, & Veterans",
-            "history": [
-                {"date": "2025-01-13", "action": "First reading, referred to Innovation, Community & Economic Development, & Veterans."},
-                {"date": "2025-01-15", "action": "Scheduled for public hearing in committee."}
-            ],
-            "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=1234&Year=2025",
-        },
-        {
-            "bill_id": 1002,
-            "bill_number": "SB 5678",
-            "title": "Establishing a statewide housing affordability program",
-            "description": "An act relating to creating a comprehensive housing affordability initiative, including incentives for affordable housing development and tenant protection measures.",
-            "status": "Passed Senate",
-            "chamber": "Senate",
-            "sponsors": ["Sen. Williams", "Sen. Davis", "Sen. Martinez"],
-            "introduced_date": "2025-01-10",
-            "last_action": "Third reading, passed; yeas, 35; nays, 14.",
-            "last_action_date": "2025-02-01",
-            "committee": "Housing",
-            "history": [
-                {"date": "2025-01-10", "action": "First reading, referred to Housing."},
-                {"date": "2025-01-18", "action": "Public hearing in the Senate Committee on Housing."},
-                {"date": "2025-01-25", "action": "Executive action taken in the Senate Committee on Housing."},
-                {"date": "2025-02-01", "action": "Third reading, passed; yeas, 35; nays, 14."}
-            ],
-            "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=5678&Year=2025",
-        },
-        {
-            "bill_id": 1003,
-            "bill_number": "HB 2001",
-            "title": "Concerning environmental protection standards",
-            "description": "An act relating to strengthening environmental protection standards for industrial facilities, including emission reporting requirements and compliance enforcement.",
-            "status": "Introduced",
-            "chamber": "House",
-            "sponsors": ["Rep. Chen"],
-            "introduced_date": "2025-01-20",
-            "last_action": "First reading, referred to Environment & Energy.",
-            "last_action_date": "2025-01-20",
-            "committee": "Environment & Energy",
-            "history": [
-                {"date": "2025-01-20", "action": "First reading, referred to Environment & Energy."}
-            ],
-            "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=2001&Year=2025",
-        },
-        {
-            "bill_id": 1004,
-            "bill_number": "SB 5100",
-            "title": "Relating to public education funding",
-            "description": "An act relating to increasing state funding for K-12 public education, including provisions for teacher compensation and classroom resources.",
-            "status": "In Committee",
-            "chamber": "Senate",
-            "sponsors": ["Sen. Thompson", "Sen. Anderson"],
-            "introduced_date": "2025-01-12",
-            "last_action": "Public hearing scheduled for February 5.",
-            "last_action_date": "2025-01-28",
-            "committee": "Early Learning & K-12 Education",
-            "history": [
-                {"date": "2025-01-12", "action": "First reading, referred to Early Learning & K-12 Education."},
-                {"date": "2025-01-20", "action": "Scheduled for public hearing."},
-                {"date": "2025-01-28", "action": "Public hearing scheduled for February 5."}
-            ],
-            "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=5100&Year=2025",
-        },
-        {
-            "bill_id": 1005,
-            "bill_number": "HB 1500",
-            "title": "Establishing healthcare price transparency requirements",
-            "description": "An act relating to requiring healthcare providers and insurers to publish pricing information for common procedures and services.",
-            "status": "Passed Committee",
-            "chamber": "House",
-            "sponsors": ["Rep. Garcia", "Rep. Lee", "Rep. Patel"],
-            "introduced_date": "2025-01-11",
-            "last_action": "Executive action taken; reported out of committee as substitute.",
-            "last_action_date": "2025-01-30",
-            "committee": "Health Care & Wellness",
-            "history": [
-                {"date": "2025-01-11", "action": "First reading, referred to Health Care & Wellness."},
-                {"date": "2025-01-22", "action": "Public hearing in committee."},
-                {"date": "2025-01-30", "action": "Executive action taken; reported out of committee as substitute."}
-            ],
-            "official_url": "https://app.leg.wa.gov/billsummary?BillNumber=1500&Year=2025",
-        },
-    ]
-
-    return sample_bills
+    # Match the API path: most recent action first. sorted() hands back a
+    # new list, and save_bills never mutates the bill dicts themselves
+    return sorted(SAMPLE_BILLS, key=lambda b: b.get("last_action_date") or "", reverse=True)
 
 
 def save_bills(bills: list[dict]) -> None:
@@ -465,11 +497,25 @@ def save_bills(bills: list[dict]) -> None:
 
     output_file = DATA_DIR / "bills.json"
 
-    # Sort by last action date (most recent first), handling None values
-    bills.sort(key=lambda b: b.get("last_action_date") or "", reverse=True)
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(bills, f, indent=2, ensure_ascii=True)  # ASCII-safe to prevent UTF-8 issues
+    # Callers hand over bills already sorted by last action date (most
+    # recent first); fetch_all_bills keeps the master list order
+
+    # Write UTF-8 rather than \u-escaped ASCII, matching the other scripts
+    # that rewrite bills.json (which would otherwise flip the file's encoding
+    # back and forth). transform_bill_data runs every API string through
+    # clean_text, so nothing unencodable reaches this point; the trade-off is
+    # that readers of bills.json must decode it as UTF-8
+    content = json.dumps(bills, indent=2, ensure_ascii=False)
+
+    # Most runs only touch a handful of bills; skip the rewrite entirely
+    # when nothing changed. Compare bytes so an existing file that isn't
+    # valid UTF-8 just gets rewritten instead of raising
+    encoded = content.encode("utf-8")
+    if output_file.exists() and output_file.read_bytes() == encoded:
+        print(f"\nNo changes to {len(bills)} bills in {output_file}")
+        return
+
+    output_file.write_bytes(encoded)
 
     print(f"\nSaved {len(bills)} bills to {output_file}")
 
@@ -4,12 +4,15 @@ Fetch campaign finance data from WA Public Disclosure Commission (PDC).
 Uses the data.wa.gov Socrata API - FREE, no key required for basic use.
 """
 
+import heapq
 import json
+import re
 import requests
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
+from itertools import chain
 
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
@@ -21,6 +24,12 @@ EXPENDITURES_URL = "https://data.wa.gov/resource/tijg-9zyp.json"
 # Current election cycles to focus on
 ELECTION_YEARS = [2024, 2022, 2020]
 
+# Suffixes dropped from names before matching (III before II so it wins)
+NAME_SUFFIX_RE = re.compile(r' (?:JR|SR|III|II|IV)')
+
+# Shared session so the per-year fetches reuse connections to data.wa.gov
+_http = requests.Session()
+
 
 def fetch_json(url: str, params: dict = None) -> list:
     """Fetch JSON from Socrata API."""
@@ -35,9 +44,11 @@ def fetch_json(url: str, params: dict = None) -> list:
     print(f"  Params: {params}")
 
     try:
-        response = requests.get(url, params=params, timeout=60)
+        response = _http.get(url, params=params, timeout=60)
         response.raise_for_status()
-        data = response.json()
+        # Parse the raw bytes directly; skips requests' decode to str
+        # on these multi-megabyte payloads
+        data = json.loads(response.content)
         print(f"  Got {len(data)} records")
         return data
     except Exception as e:
@@ -50,10 +61,7 @@ def normalize_name(name: str) -> str:
     if not name:
         return ""
     # Remove common suffixes and normalize
-    name = name.upper().strip()
-    for suffix in [' JR', ' SR', ' III', ' II', ' IV']:
-        name = name.replace(suffix, '')
-    return name
+    return NAME_SUFFIX_RE.sub('', name.upper().strip())
 
 
 def match_legislator(filer_name: str, legislators: dict) -> str | None:
@@ -89,6 +97,24 @@ def match_legislator(filer_name: str, legislators: dict) -> str | None:
     return None
 
 
+def fetch_contributions(year: int) -> list:
+    """Fetch state legislative contributions for one election year."""
+    print(f"\nElection Year: {year}")
+
+    # Query for state legislative contributions
+    # jurisdiction_type=Legislative covers state reps and senators
+    params = {
+        '$limit': 50000,
+        'type': 'Candidate',
+        'jurisdiction_type': 'Legislative',
+        'election_year': str(year),
+        '$select': 'id,filer_name,contributor_name,contributor_city,contributor_employer_name,amount,receipt_date,contributor_category,office,party,legislative_district',
+        '$order': 'amount DESC'
+    }
+
+    return fetch_json(CONTRIBUTIONS_URL, params)
+
+
 def fetch_campaign_finance():
     """Fetch campaign finance data for WA legislators."""
     print("=" * 60)
@@ -123,26 +149,11 @@ def fetch_campaign_finance():
     print("Fetching Contribution Data")
     print("=" * 40)
 
-    all_contributions = []
-
-    for year in ELECTION_YEARS:
-        print(f"\nElection Year: {year}")
-
-        # Query for state legislative contributions
-        # jurisdiction_type=Legislative covers state reps and senators
-        params = {
-            '$limit': 50000,
-            'type': 'Candidate',
-            'jurisdiction_type': 'Legislative',
-            'election_year': str(year),
-            '$select': 'id,filer_name,contributor_name,contributor_city,contributor_employer_name,amount,receipt_date,contributor_category,office,party,legislative_district',
-            '$order': 'amount DESC'
-        }
-
-        contributions = fetch_json(CONTRIBUTIONS_URL, params)
-        all_contributions.extend(contributions)
-
-        time.sleep(1)  # Rate limit courtesy
+    # Each election year is an independent request, so fetch them in
+    # parallel; map() keeps the results in ELECTION_YEARS order
+    with ThreadPoolExecutor(max_workers=len(ELECTION_YEARS)) as executor:
+        results = list(executor.map(fetch_contributions, ELECTION_YEARS))
+    all_contributions = list(chain.from_iterable(results))
 
     print(f"\nTotal contributions fetched: {len(all_contributions)}")
 
@@ -150,10 +161,15 @@ def fetch_campaign_finance():
     print("\nProcessing contributions...")
     matched_count = 0
     unmatched_filers = set()
+    # Contributions repeat the same few hundred filer names, so run the
+    # fuzzy matcher once per distinct name
+    filer_matches = {}
 
     for contrib in all_contributions:
         filer_name = contrib.get('filer_name', '')
-        leg_name = match_legislator(filer_name, legislators)
+        if filer_name not in filer_matches:
+            filer_matches[filer_name] = match_legislator(filer_name, legislators)
+        leg_name = filer_matches[filer_name]
 
         if leg_name and leg_name in legislators:
             leg = legislators[leg_name]
@@ -184,30 +200,33 @@ def fetch_campaign_finance():
     print("\nCalculating top donors...")
     for leg in legislators.values():
         # Aggregate by donor name
-        donor_totals = defaultdict(lambda: {'total': 0, 'employer': '', 'count': 0})
+        donor_totals = Counter()
+        donor_counts = Counter()
+        donor_employers = {}
         for contrib in leg['contributions']:
             donor = contrib['donor']
-            donor_totals[donor]['total'] += contrib['amount']
-            donor_totals[donor]['employer'] = contrib.get('employer', '')
-            donor_totals[donor]['count'] += 1
+            donor_totals[donor] += contrib['amount']
+            donor_counts[donor] += 1
+            donor_employers[donor] = contrib.get('employer', '')
 
-        # Sort and get top 20
-        sorted_donors = sorted(donor_totals.items(), key=lambda x: -x[1]['total'])
+        # Get top 20 without sorting every donor
+        top_donors = heapq.nlargest(20, donor_totals.items(), key=lambda x: x[1])
         leg['top_donors'] = [
             {
                 'name': donor,
-                'total': round(info['total'], 2),
-                'employer': info['employer'],
-                'count': info['count']
+                'total': round(total, 2),
+                'employer': donor_employers[donor],
+                'count': donor_counts[donor]
             }
-            for donor, info in sorted_donors[:20]
+            for donor, total in top_donors
         ]
 
-        # Convert categories to list
+        # Convert top categories to list
+        top_categories = heapq.nlargest(10, leg['donor_categories'].items(), key=lambda x: x[1])
         leg['donor_categories'] = [
             {'category': cat, 'total': round(amount, 2)}
-            for cat, amount in sorted(leg['donor_categories'].items(), key=lambda x: -x[1])
-        ][:10]
+            for cat, amount in top_categories
+        ]
 
         # Keep only summary of contributions (not full list)
         leg['contribution_count'] = len(leg['contributions'])
@@ -4,11 +4,13 @@ Fetch Washington State legislator data from official sources.
 Combines WA Legislature Web Services with bill sponsorship data.
 """
 
+import io
 import json
 import requests
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from collections import defaultdict
+from collections.abc import Iterator
 
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
@@ -17,13 +19,25 @@ DATA_DIR = ROOT_DIR / "_data"
 WA_LEG_BASE = "https://wslwebservices.leg.wa.gov"
 BIENNIUM = "2025-26"
 
+# Namespace used by the web service XML, in ElementTree's {uri}tag form
+WSL_NS = "{http://WSLWebServices.leg.wa.gov/}"
 
-def fetch_xml(url: str) -> ET.Element:
-    """Fetch XML from URL and return root element."""
+# House and Senate lists come from the same host; reuse the connection
+_http = requests.Session()
+
+
+def fetch_members(url: str) -> Iterator[ET.Element]:
+    """Fetch sponsor XML from URL and yield each member element."""
     print(f"  Fetching: {url}")
-    response = requests.get(url, timeout=30)
+    response = _http.get(url, timeout=30)
     response.raise_for_status()
-    return ET.fromstring(response.content)
+
+    # Walk the parse events instead of building the whole tree; a member is
+    # complete at its end event and is cleared once it has been read
+    for _, elem in ET.iterparse(io.BytesIO(response.content)):
+        if 'Member' in elem.tag or 'Sponsor' in elem.tag:
+            yield elem
+            elem.clear()
 
 
 def get_photo_url(first_name: str, last_name: str, chamber: str) -> str:
@@ -43,17 +57,19 @@ def get_photo_url(first_name: str, last_name: str, chamber: str) -> str:
 
 def parse_sponsor(elem) -> dict:
     """Parse a sponsor XML element into a dict."""
-    # Handle namespaces in the XML
-    ns = {'': 'http://WSLWebServices.leg.wa.gov/'}
+    # Index the direct children once instead of scanning them per field
+    children = {}
+    for child in elem:
+        children.setdefault(child.tag, child)
 
     def get_text(tag):
         # Try with namespace first, then without
-        el = elem.find(tag, ns) if ns else elem.find(tag)
+        el = children.get(WSL_NS + tag)
         if el is None:
-            el = elem.find(tag)
+            el = children.get(tag)
         if el is None:
             # Try lowercase
-            el = elem.find(tag.lower())
+            el = children.get(tag.lower())
         return el.text if el is not None else ""
 
     first_name = get_text('FirstName')
@@ -86,15 +102,12 @@ def fetch_legislators():
     print("\nFetching House members...")
     try:
         house_url = f"{WA_LEG_BASE}/SponsorService.asmx/GetHouseSponsors?biennium={BIENNIUM}"
-        root = fetch_xml(house_url)
-
-        for member in root.iter():
-            if 'Member' in member.tag or 'Sponsor' in member.tag:
-                data = parse_sponsor(member)
-                if data.get('name'):
-                    data['chamber'] = 'House'
-                    data['title'] = 'Representative'
-                    legislators[data['name']] = data
+        for member in fetch_members(house_url):
+            data = parse_sponsor(member)
+            if data.get('name'):
+                data['chamber'] = 'House'
+                data['title'] = 'Representative'
+                legislators[data['name']] = data
 
         print(f"  Found {len([l for l in legislators.values() if l['chamber'] == 'House'])} House members")
     except Exception as e:
@@ -104,15 +117,12 @@ def fetch_legislators():
     print("\nFetching Senate members...")
     try:
         senate_url = f"{WA_LEG_BASE}/SponsorService.asmx/GetSenateSponsors?biennium={BIENNIUM}"
-        root = fetch_xml(senate_url)
-
-        for member in root.iter():
-            if 'Member' in member.tag or 'Sponsor' in member.tag:
-                data = parse_sponsor(member)
-                if data.get('name'):
-                    data['chamber'] = 'Senate'
-                    data['title'] = 'Senator'
-                    legislators[data['name']] = data
+        for member in fetch_members(senate_url):
+            data = parse_sponsor(member)
+            if data.get('name'):
+                data['chamber'] = 'Senate'
+                data['title'] = 'Senator'
+                legislators[data['name']] = data
 
         print(f"  Found {len([l for l in legislators.values() if l['chamber'] == 'Senate'])} Senate members")
     except Exception as e:
@@ -224,6 +234,11 @@ def enrich_with_bills(legislators: dict) -> dict:
     # Track sponsorships
     harmful_levels = {'critical', 'high'}
 
+    # Lowercase legislator names once for the partial-match fallback, and
+    # resolve each distinct sponsor name only once (names repeat across bills)
+    lowered_names = [(leg_name.lower(), leg) for leg_name, leg in legislators.items()]
+    sponsor_matches = {}
+
     for bill in bills:
         sponsors = bill.get('sponsors', [])
         if isinstance(sponsors, str):
@@ -240,15 +255,19 @@ def enrich_with_bills(legislators: dict) -> dict:
                 name = sponsor
 
             # Try to match legislator
-            matched = None
-            if name in legislators:
-                matched = legislators[name]
-            else:
-                # Try partial match
-                for leg_name, leg in legislators.items():
-                    if name.lower() in leg_name.lower() or leg_name.lower() in name.lower():
-                        matched = leg
-                        break
+            if name not in sponsor_matches:
+                matched = None
+                if name in legislators:
+                    matched = legislators[name]
+                else:
+                    # Try partial match
+                    name_lower = name.lower()
+                    for leg_name_lower, leg in lowered_names:
+                        if name_lower in leg_name_lower or leg_name_lower in name_lower:
+                            matched = leg
+                            break
+                sponsor_matches[name] = matched
+            matched = sponsor_matches[name]
 
             if matched:
                 matched['bills_sponsored'].append(bill_number)
@@ -10,10 +10,13 @@ Usage:
 """
 
 import json
-import time
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from rate_limit import RateLimiter
+
 try:
     import requests
 except ImportError:
@@ -24,6 +27,25 @@ DATA_DIR = Path(__file__).parent.parent / "_data"
 BIENNIUM = "2025-26"
 REQUEST_DELAY = 0.2  # Be nice to the API
 
+# Worker threads overlap request latency; they share one rate limiter, so
+# requests still start at most once every REQUEST_DELAY seconds
+MAX_WORKERS = 10
+
+# Threat levels counted toward harmful_bills_count
+HARMFUL_LEVELS = frozenset({'critical', 'high'})
+
+# Title prefixes stripped from lowercased sponsor names before matching
+TITLE_PREFIX_RE = re.compile(r'^(?:rep\. |sen\. |representative |senator )')
+
+# Sponsor display names in the GetSponsors XML (matched on bytes, so the
+# response never has to be decoded as a whole)
+LONG_NAME_RE = re.compile(rb'<LongName>([^<]+)</LongName>')
+
+_rate_limiter = RateLimiter(REQUEST_DELAY)
+
+# One pooled session so the workers reuse keep-alive connections
+_http = requests.Session()
+
 
 def get_sponsors(bill_number: str) -> list[str]:
     """Fetch sponsors for a bill from WA Legislature API."""
@@ -40,20 +62,17 @@ def get_sponsors(bill_number: str) -> list[str]:
         "billId": bill_number.replace(" ", " ")  # Keep format like "HB 1234"
     }
 
+    _rate_limiter.wait()
+
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _http.get(url, params=params, timeout=10)
         response.raise_for_status()
 
-        # Parse XML response
-        content = response.text
-
-        # Extract sponsor names from XML
+        # Extract sponsor names from the raw XML bytes
         # Format: <LongName>Representative Abbarno</LongName>
-        sponsors = []
-        import re
         # Use LongName for better readability
-        names = re.findall(r'<LongName>([^<]+)</LongName>', content)
-        sponsors = [name.strip() for name in names if name.strip()]
+        names = (raw.decode('utf-8').strip() for raw in LONG_NAME_RE.findall(response.content))
+        sponsors = [name for name in names if name]
 
         return sponsors
     except Exception as e:
@@ -61,57 +80,32 @@ def get_sponsors(bill_number: str) -> list[str]:
         return []
 
 
-def update_bills_with_sponsors():
-    """Update bills.json with sponsor information."""
-    bills_file = DATA_DIR / "bills.json"
-
-    if not bills_file.exists():
-        print("Error: bills.json not found")
-        return 1
-
-    with open(bills_file, 'r') as f:
-        bills = json.load(f)
-
+def update_bills_with_sponsors(bills: list[dict]) -> int:
+    """Fill in each bill's sponsors; returns the number of bills updated."""
     print(f"Updating sponsors for {len(bills)} bills...")
 
     updated = 0
-    for i, bill in enumerate(bills):
-        bill_number = bill.get('bill_number', '')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_sponsors, bill.get('bill_number', '')): bill
+            for bill in bills
+        }
 
-        if i % 100 == 0:
-            print(f"  Processing bill {i+1}/{len(bills)}...")
+        for i, future in enumerate(as_completed(futures)):
+            if i % 100 == 0:
+                print(f"  Processing bill {i+1}/{len(bills)}...")
 
-        sponsors = get_sponsors(bill_number)
+            sponsors = future.result()
 
-        if sponsors:
-            bill['sponsors'] = sponsors
-            updated += 1
+            if sponsors:
+                futures[future]['sponsors'] = sponsors
+                updated += 1
 
-        time.sleep(REQUEST_DELAY)
+    return updated
 
-    # Save updated bills
-    with open(bills_file, 'w') as f:
-        json.dump(bills, f, indent=2, ensure_ascii=False)
-
-    print(f"\nUpdated {updated} bills with sponsor information")
-    return 0
-
-
-def update_legislator_bill_counts():
-    """Update legislators.json with bill counts based on sponsorship."""
-    bills_file = DATA_DIR / "bills.json"
-    legislators_file = DATA_DIR / "legislators.json"
-
-    if not bills_file.exists() or not legislators_file.exists():
-        print("Error: Required data files not found")
-        return 1
-
-    with open(bills_file, 'r') as f:
-        bills = json.load(f)
-
-    with open(legislators_file, 'r') as f:
-        legislators = json.load(f)
 
+def update_legislator_bill_counts(bills: list[dict], legislators: list[dict]) -> None:
+    """Update legislators with bill counts based on sponsorship."""
     # Build a map of legislator names to their data
     # Need to handle various name formats
     leg_map = {}
@@ -120,49 +114,93 @@ def update_legislator_bill_counts():
         # Store by full name
         leg_map[name.lower()] = leg
         # Also store by last name for matching "Rep. LastName" format
-        last_name = leg.get('last_name', '').lower()
+        last_name = (leg.get('last_name') or '').lower()
         if last_name:
             leg_map[last_name] = leg
 
+    # The same sponsor strings repeat across bills; clean and match each once
+    sponsor_matches = {}
+
     # Count bills per legislator
     for bill in bills:
         sponsors = bill.get('sponsors', [])
         threat_level = bill.get('threat_level', 'low')
 
         for sponsor in sponsors:
-            # Try to match sponsor to legislator
-            # Sponsors might be "Rep. John Smith" or "Sen. Jane Doe"
-            sponsor_clean = sponsor.lower()
-
-            # Remove title prefix
-            for prefix in ['rep. ', 'sen. ', 'representative ', 'senator ']:
-                if sponsor_clean.startswith(prefix):
-                    sponsor_clean = sponsor_clean[len(prefix):]
-                    break
-
-            # Try full name match first
-            matched_leg = leg_map.get(sponsor_clean)
-
-            # Try last name match if no full match
-            if not matched_leg:
-                # Get last word as last name
-                parts = sponsor_clean.split()
-                if parts:
-                    last_name = parts[-1]
-                    matched_leg = leg_map.get(last_name)
+            if sponsor not in sponsor_matches:
+                # Try to match sponsor to legislator
+                # Sponsors might be "Rep. John Smith" or "Sen. Jane Doe"
+                sponsor_clean = sponsor.lower()
+
+                # Remove title prefix
+                sponsor_clean = TITLE_PREFIX_RE.sub('', sponsor_clean, count=1)
+
+                # Try full name match first
+                matched_leg = leg_map.get(sponsor_clean)
+
+                # Try last name match if no full match
+                if not matched_leg:
+                    # Get last word as last name
+                    parts = sponsor_clean.split()
+                    if parts:
+                        last_name = parts[-1]
+                        matched_leg = leg_map.get(last_name)
+
+                sponsor_matches[sponsor] = matched_leg
+            matched_leg = sponsor_matches[sponsor]
 
             if matched_leg:
                 # Increment bill count
                 matched_leg['bills_count'] = matched_leg.get('bills_count', 0) + 1
 
                 # Track harmful bills
-                if threat_level in ['critical', 'high']:
+                if threat_level in HARMFUL_LEVELS:
                     matched_leg['harmful_bills_count'] = matched_leg.get('harmful_bills_count', 0) + 1
                     if threat_level == 'critical':
                         matched_leg['critical_bills'] = matched_leg.get('critical_bills', 0) + 1
                     else:
                         matched_leg['high_bills'] = matched_leg.get('high_bills', 0) + 1
 
+
+def run() -> int:
+    """Fetch sponsors, then update legislator bill counts.
+
+    Both stages share the in-memory bills, so each data file is read and
+    written once.
+    """
+    bills_file = DATA_DIR / "bills.json"
+    legislators_file = DATA_DIR / "legislators.json"
+
+    if not bills_file.exists():
+        print("Error: bills.json not found")
+        return 1
+
+    with open(bills_file, 'r') as f:
+        bills = json.load(f)
+
+    # First fetch sponsors for all bills
+    updated = update_bills_with_sponsors(bills)
+
+    # Save updated bills
+    with open(bills_file, 'w') as f:
+        json.dump(bills, f, indent=2, ensure_ascii=False)
+
+    print(f"\nUpdated {updated} bills with sponsor information")
+
+    print("\n" + "=" * 60)
+    print("Updating legislator bill counts...")
+    print("=" * 60 + "\n")
+
+    if not legislators_file.exists():
+        print("Error: Required data files not found")
+        return 1
+
+    with open(legislators_file, 'r') as f:
+        legislators = json.load(f)
+
+    # Then update legislator counts
+    update_legislator_bill_counts(bills, legislators)
+
     # Save updated legislators
     with open(legislators_file, 'w') as f:
         json.dump(legislators, f, indent=2, ensure_ascii=False)
@@ -179,15 +217,4 @@ if __name__ == '__main__':
     print("WA Bill Tracker - Sponsor Fetch")
     print("=" * 60 + "\n")
 
-    # First fetch sponsors for all bills
-    result = update_bills_with_sponsors()
-    if result != 0:
-        sys.exit(result)
-
-    print("\n" + "=" * 60)
-    print("Updating legislator bill counts...")
-    print("=" * 60 + "\n")
-
-    # Then update legislator counts
-    result = update_legislator_bill_counts()
-    sys.exit(result)
+    sys.exit(run())
@@ -12,18 +12,58 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 DATA_DIR = Path(__file__).parent.parent / "_data"
 BIENNIUM = "2025-26"
 
+# Sponsor lists reused across runs until they are a day old
+SPONSOR_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "sponsors"
+SPONSOR_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Sponsor names in the GetSponsors XML, matched on the raw response bytes
+LONG_NAME_RE = re.compile(rb'<LongName>([^<]+)</LongName>')
+
+# Threat levels counted toward harmful_bills_count
+HARMFUL_LEVELS = frozenset({'critical', 'high'})
+
+# Shared session so the worker threads reuse keep-alive connections
+_http = requests.Session()
+
+
+def read_cached_sponsors(bill_number: str) -> list[str] | None:
+    """Return a fresh cached sponsor list for a bill, or None."""
+    cache_file = SPONSOR_CACHE_DIR / f"{bill_number.replace(' ', '')}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < SPONSOR_CACHE_MAX_AGE:
+            return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def write_cached_sponsors(bill_number: str, sponsors: list[str]) -> None:
+    """Store a bill's sponsor list so later runs can skip the request."""
+    SPONSOR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = SPONSOR_CACHE_DIR / f"{bill_number.replace(' ', '')}.json"
+    cache_file.write_text(json.dumps(sponsors), encoding='utf-8')
+
 
 def get_sponsors(bill_number: str) -> tuple[str, list[str]]:
     """Fetch sponsors for a bill."""
+    cached = read_cached_sponsors(bill_number)
+    if cached is not None:
+        return bill_number, cached
+
     url = 'https://wslwebservices.leg.wa.gov/LegislationService.asmx/GetSponsors'
     params = {'biennium': BIENNIUM, 'billId': bill_number}
     try:
-        resp = requests.get(url, params=params, timeout=10)
-        names = re.findall(r'<LongName>([^<]+)</LongName>', resp.text)
-        return bill_number, [name.strip() for name in names if name.strip()]
+        resp = _http.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        names = (raw.decode('utf-8').strip() for raw in LONG_NAME_RE.findall(resp.content))
+        sponsors = [name for name in names if name]
     except:
+        # Failed lookups are not cached, so the next run retries them
         return bill_number, []
 
+    write_cached_sponsors(bill_number, sponsors)
+    return bill_number, sponsors
+
 
 def main():
     bills_file = DATA_DIR / "bills.json"
@@ -95,15 +135,16 @@ def main():
                 leg = leg_by_lastname.get(last_name)
 
                 if leg:
-                    leg['bills_count'] = leg.get('bills_count', 0) + 1
+                    # Counters were all reset to 0 above
+                    leg['bills_count'] += 1
                     leg['bills_sponsored'].append(bill_number)
 
-                    if threat_level in ['critical', 'high']:
-                        leg['harmful_bills_count'] = leg.get('harmful_bills_count', 0) + 1
+                    if threat_level in HARMFUL_LEVELS:
+                        leg['harmful_bills_count'] += 1
                         if threat_level == 'critical':
-                            leg['critical_bills'] = leg.get('critical_bills', 0) + 1
+                            leg['critical_bills'] += 1
                         else:
-                            leg['high_bills'] = leg.get('high_bills', 0) + 1
+                            leg['high_bills'] += 1
 
     with open(legislators_file, 'w') as f:
         json.dump(legislators, f, indent=2, ensure_ascii=False)
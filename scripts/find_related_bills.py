@@ -5,7 +5,7 @@ Find related bills based on title similarity and bill number patterns.
 
 import json
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.parent
@@ -23,10 +23,22 @@ TOPIC_KEYWORDS = {
     'transportation': ['transportation', 'highway', 'transit', 'traffic', 'vehicle'],
 }
 
+# Common stopwords removed before comparing titles
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'shall', 'concerning',
+    'relating', 'regarding', 'making', 'providing', 'establishing',
+})
+
+WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+BILL_NUMBER_RE = re.compile(r'([A-Z]+)\s*(\d+)')
+
 
 def extract_bill_number(bill_number: str) -> tuple:
     """Extract prefix and number from bill number."""
-    match = re.match(r'([A-Z]+)\s*(\d+)', bill_number.upper())
+    match = BILL_NUMBER_RE.match(bill_number.upper())
     if match:
         return match.group(1), int(match.group(2))
     return None, None
@@ -34,23 +46,17 @@ def extract_bill_number(bill_number: str) -> tuple:
 
 def get_words(text: str) -> set:
     """Extract meaningful words from text."""
-    # Remove common stopwords
-    stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                 'could', 'should', 'may', 'might', 'must', 'shall', 'concerning',
-                 'relating', 'regarding', 'making', 'providing', 'establishing'}
-
-    words = set(re.findall(r'\b[a-z]{3,}\b', text.lower()))
-    return words - stopwords
+    words = set(WORD_RE.findall(text.lower()))
+    return words - STOPWORDS
 
 
 def word_overlap(words1: set, words2: set) -> float:
     """Calculate word overlap ratio."""
     if not words1 or not words2:
         return 0.0
+    # |A | B| = |A| + |B| - |A & B|, so the union set is never built
     intersection = len(words1 & words2)
-    union = len(words1 | words2)
+    union = len(words1) + len(words2) - intersection
     return intersection / union if union > 0 else 0.0
 
 
@@ -94,9 +100,19 @@ def find_related_bills():
         if topic:
             by_topic[topic].append(bill)
 
-        # Pre-compute word set
+        # Pre-compute topic and word set
+        bill['_topic'] = topic
         bill['_words'] = get_words(title)
 
+    # Inverted index per topic: word -> positions in by_topic[topic]
+    topic_indexes = {}
+    for topic, topic_bills in by_topic.items():
+        index = defaultdict(list)
+        for i, other in enumerate(topic_bills):
+            for word in other['_words']:
+                index[word].append(i)
+        topic_indexes[topic] = index
+
     # Find relations
     related_count = 0
     clusters = defaultdict(set)
@@ -118,16 +134,29 @@ def find_related_bills():
                         related.add(companion['bill_number'])
 
         # 2. Find bills with similar titles (>50% word overlap)
-        title = bill.get('title', '')
-        topic = find_topic(title)
+        topic = bill['_topic']
 
         if topic:
             cluster_key = f"{topic}"
             clusters[cluster_key].add(bill_number)
 
-            for other in by_topic[topic]:
+            # Count shared words through the index instead of comparing
+            # against every bill in the topic. An overlap above 0.5 needs
+            # more than half of this bill's words in common, so bills
+            # sharing fewer can be skipped without computing the ratio
+            words = bill['_words']
+            index = topic_indexes[topic]
+            shared = Counter()
+            for word in words:
+                shared.update(index[word])
+
+            topic_bills = by_topic[topic]
+            for i, common in shared.items():
+                if common * 2 <= len(words):
+                    continue
+                other = topic_bills[i]
                 if other['bill_number'] != bill_number:
-                    overlap = word_overlap(bill['_words'], other['_words'])
+                    overlap = common / (len(words) + len(other['_words']) - common)
                     if overlap > 0.5:
                         related.add(other['bill_number'])
 
@@ -139,8 +168,8 @@ def find_related_bills():
 
     # Clean up temp data
     for bill in bills:
-        if '_words' in bill:
-            del bill['_words']
+        del bill['_topic']
+        del bill['_words']
 
     print(f"Found relations for {related_count} bills")
     print(f"Generated {len(clusters)} bill clusters")
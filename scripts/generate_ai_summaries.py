@@ -15,21 +15,27 @@ Usage:
     python scripts/generate_ai_summaries.py          # Process all bills needing summaries
     python scripts/generate_ai_summaries.py --test   # Test with sample data (no API calls)
     python scripts/generate_ai_summaries.py --limit 5  # Process only 5 bills
+    python scripts/generate_ai_summaries.py --refresh-cache  # Ignore cached summaries
 
 Environment Variables:
     OPENROUTER_API_KEY: Your OpenRouter API key (required for actual API calls)
 """
 
+import hashlib
 import json
 import os
 import sys
-import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from rate_limit import RateLimiter
+
 # Try to import requests, handle gracefully if not available
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library not installed. Run: pip install requests")
     sys.exit(1)
@@ -37,6 +43,7 @@ except ImportError:
 # Paths
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
+SUMMARY_CACHE_DIR = ROOT_DIR / ".cache" / "ai_summaries"  # Summaries keyed by hash of (model, prompt)
 
 # OpenRouter API configuration
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -51,6 +58,40 @@ FREE_MODELS = [
 # Rate limiting: 20 requests per minute for free tier
 RATE_LIMIT_DELAY = 3.0  # seconds between requests (20/min = 3s each)
 
+# The gap between requests backs off from RATE_LIMIT_DELAY: it doubles
+# after any 429 and shrinks by DELAY_DECREASE after every request that
+# wasn't rate limited. It never drops below the documented quota, so a
+# run doesn't go looking for 429s
+MIN_REQUEST_DELAY = RATE_LIMIT_DELAY
+MAX_REQUEST_DELAY = 60.0
+DELAY_DECREASE = 0.1
+RATE_LIMIT_RETRIES = 3  # attempts per bill when OpenRouter answers 429
+
+# Bills are summarized on worker threads so request latency overlaps; the
+# threads share one rate limiter, so requests still start the current
+# request gap apart
+MAX_WORKERS = 3
+
+# Write bills.json after every this many new summaries
+CHECKPOINT_EVERY = 10
+
+_rate_limiter = RateLimiter(RATE_LIMIT_DELAY)
+
+# Pooled session: reuses the connection to OpenRouter and retries server
+# errors with backoff. 429s are left to update_rate_limit so the shared
+# limiter slows every thread down, and read=0 keeps a timed-out POST from
+# being resubmitted. After the last retry the final response is returned,
+# not raised
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=3,
+    read=0,
+    backoff_factor=1.0,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)))
+
 # Analysis prompt template
 ANALYSIS_PROMPT = """You are a constitutional watchdog analyzing Washington State legislation from an American nationalist, pro-republic perspective.
 
@@ -88,16 +129,36 @@ def get_api_key():
     return api_key
 
 
-def generate_summary(bill: dict, api_key: str, model: str = None) -> str | None:
-    """
-    Generate an AI summary for a bill using OpenRouter API.
+def update_rate_limit(response: requests.Response) -> None:
+    """Adjust the shared request gap based on how OpenRouter responded."""
+    if response.status_code != 429:
+        _rate_limiter.recover(DELAY_DECREASE, MIN_REQUEST_DELAY)
+        return
 
-    Returns the summary text or None if generation fails.
-    """
-    if model is None:
-        model = FREE_MODELS[0]
+    # Hold every thread off until the server says to retry
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        retry_after = 0
+    _rate_limiter.back_off(MAX_REQUEST_DELAY, min(retry_after, MAX_REQUEST_DELAY))
 
-    # Build the prompt with bill context
+
+def read_cached_summary(cache_key: str) -> str | None:
+    """Return a cached summary for a cache key, or None if not cached."""
+    cache_file = SUMMARY_CACHE_DIR / f"{cache_key}.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='utf-8')
+    return None
+
+
+def write_cached_summary(cache_key: str, summary: str) -> None:
+    """Store a summary so later runs can skip the request that produced it."""
+    SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (SUMMARY_CACHE_DIR / f"{cache_key}.txt").write_text(summary, encoding='utf-8')
+
+
+def build_prompt(bill: dict) -> str:
+    """Fill the analysis prompt with a bill's context."""
     title = bill.get("title", "Unknown")
     description = bill.get("description", "")
 
@@ -105,13 +166,61 @@ def generate_summary(bill: dict, api_key: str, model: str = None) -> str | None:
     if not description:
         description = f"(No official description available. Analyze based on title: {title})"
 
-    prompt = ANALYSIS_PROMPT.format(
+    return ANALYSIS_PROMPT.format(
         title=title,
         description=description,
         threat_level=bill.get("threat_label", "Unknown"),
         concerns=", ".join(bill.get("concerns", [])) or "None identified by keyword scan"
     )
 
+
+def summary_cache_key(model: str, prompt: str) -> str:
+    """Cache key for the answer a model gives to a prompt."""
+    return hashlib.sha256(f"{model}|{prompt}".encode('utf-8')).hexdigest()
+
+
+def fill_cached_summaries(bills_needing_summary: list[dict], bills_by_id: dict) -> list[dict]:
+    """
+    Apply summaries the primary model already produced for these exact prompts.
+
+    Returns the bills still needing a request.
+    """
+    cached_keys = {p.stem for p in SUMMARY_CACHE_DIR.glob("*.txt")}
+    if not cached_keys:
+        return bills_needing_summary
+
+    remaining = []
+    for bill in bills_needing_summary:
+        cache_key = summary_cache_key(FREE_MODELS[0], build_prompt(bill))
+        summary = read_cached_summary(cache_key) if cache_key in cached_keys else None
+        if summary:
+            bills_by_id[bill.get("bill_id")]["ai_summary"] = summary
+        else:
+            remaining.append(bill)
+    return remaining
+
+
+def generate_summary(bill: dict, api_key: str, model: str = None,
+                     use_cache: bool = True) -> str | None:
+    """
+    Generate an AI summary for a bill using OpenRouter API.
+
+    The prompt covers everything the summary depends on (title,
+    description, threat label, concerns), so a hash of model and prompt
+    identifies a cached answer.
+
+    Returns the summary text or None if generation fails.
+    """
+    if model is None:
+        model = FREE_MODELS[0]
+
+    prompt = build_prompt(bill)
+    cache_key = summary_cache_key(model, prompt)
+    if use_cache:
+        cached = read_cached_summary(cache_key)
+        if cached:
+            return cached
+
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -128,31 +237,41 @@ def generate_summary(bill: dict, api_key: str, model: str = None) -> str | None:
         "temperature": 0.3  # Lower temperature for more consistent analysis
     }
 
+    bill_number = bill.get("bill_number", "Unknown")
+
     try:
-        response = requests.post(
-            OPENROUTER_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=30
-        )
+        # A 429 backs off the shared limiter, so the retry (and every other
+        # thread) waits out the Retry-After before the next request
+        for attempt in range(RATE_LIMIT_RETRIES):
+            _rate_limiter.wait()
+            response = _http.post(
+                OPENROUTER_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=30
+            )
+            update_rate_limit(response)
+            if response.status_code != 429:
+                break
+            if attempt + 1 < RATE_LIMIT_RETRIES:
+                print(f"  {bill_number}: rate limited, retrying...")
 
         if response.status_code == 200:
             data = response.json()
             if "choices" in data and len(data["choices"]) > 0:
-                return data["choices"][0]["message"]["content"].strip()
-        elif response.status_code == 429:
-            print(f"  Rate limited. Waiting 60 seconds...")
-            time.sleep(60)
-            return None
+                summary = data["choices"][0]["message"]["content"].strip()
+                if summary:
+                    write_cached_summary(cache_key, summary)
+                return summary
         else:
-            print(f"  API error {response.status_code}: {response.text[:100]}")
+            print(f"  {bill_number}: API error {response.status_code}: {response.text[:100]}")
             return None
 
     except requests.exceptions.Timeout:
-        print(f"  Request timed out")
+        print(f"  {bill_number}: request timed out")
         return None
     except requests.exceptions.RequestException as e:
-        print(f"  Request error: {e}")
+        print(f"  {bill_number}: request error: {e}")
         return None
 
     return None
@@ -173,13 +292,44 @@ def get_test_summary(bill: dict) -> str:
         return f"[TEST] Requires scrutiny. Government rarely passes 'neutral' legislation - look for hidden mandates, fee increases, or regulatory expansion buried in the text."
 
 
-def process_bills(test_mode: bool = False, limit: int = None):
+def summarize_bill(bill: dict, api_key: str, test_mode: bool = False,
+                   use_cache: bool = True) -> str | None:
+    """Generate a summary for one bill, trying fallback models in order.
+
+    Runs in a worker thread; results are merged on the main thread.
+    """
+    if test_mode:
+        return get_test_summary(bill)
+
+    summary = generate_summary(bill, api_key, use_cache=use_cache)
+
+    # Try fallback models if first one fails
+    if summary is None:
+        for fallback_model in FREE_MODELS[1:]:
+            print(f"  {bill.get('bill_number', 'Unknown')}: trying fallback model: {fallback_model}")
+            summary = generate_summary(bill, api_key, fallback_model, use_cache)
+            if summary:
+                break
+
+    return summary
+
+
+def save_bills(bills: list[dict], bills_file: Path) -> None:
+    """Write bills atomically, so an interrupted write never truncates the file."""
+    tmp_file = bills_file.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(bills, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, bills_file)
+
+
+def process_bills(test_mode: bool = False, limit: int = None, refresh_cache: bool = False):
     """
     Process bills and generate AI summaries for those without them.
 
     Args:
         test_mode: If True, use test summaries instead of API calls
         limit: Maximum number of bills to process (None for all)
+        refresh_cache: If True, ignore cached summaries and call the API
     """
     bills_file = DATA_DIR / "bills.json"
 
@@ -191,6 +341,12 @@ def process_bills(test_mode: bool = False, limit: int = None):
     with open(bills_file, 'r', encoding='utf-8') as f:
         bills = json.load(f)
 
+    # Index by bill_id for merging results back (first bill wins, as the
+    # old linear scan did)
+    bills_by_id = {}
+    for b in bills:
+        bills_by_id.setdefault(b.get("bill_id"), b)
+
     # Filter bills that need summaries
     bills_needing_summary = [
         b for b in bills
@@ -203,11 +359,6 @@ def process_bills(test_mode: bool = False, limit: int = None):
         print("All bills already have summaries. Nothing to do.")
         return 0
 
-    # Apply limit if specified
-    if limit:
-        bills_needing_summary = bills_needing_summary[:limit]
-        print(f"Processing limited to {limit} bills")
-
     # Get API key (unless test mode)
     api_key = None
     if not test_mode:
@@ -216,48 +367,63 @@ def process_bills(test_mode: bool = False, limit: int = None):
             print("No API key available. Use --test for test mode.")
             return 0  # Not an error, just skip
 
+    # Summaries already cached for the current prompt don't need the
+    # worker pool or a rate limit slot, and don't count toward --limit
+    from_cache = 0
+    if not test_mode and not refresh_cache:
+        remaining = fill_cached_summaries(bills_needing_summary, bills_by_id)
+        from_cache = len(bills_needing_summary) - len(remaining)
+        bills_needing_summary = remaining
+        if from_cache:
+            print(f"Filled {from_cache} summaries from cache")
+
+    # Apply limit if specified
+    if limit:
+        bills_needing_summary = bills_needing_summary[:limit]
+        print(f"Processing limited to {limit} bills")
+
     # Process bills
     summaries_generated = 0
     errors = 0
 
-    for i, bill in enumerate(bills_needing_summary):
-        bill_number = bill.get("bill_number", "Unknown")
-        print(f"[{i+1}/{len(bills_needing_summary)}] Processing {bill_number}...")
-
-        if test_mode:
-            summary = get_test_summary(bill)
-        else:
-            summary = generate_summary(bill, api_key)
-
-            # Try fallback models if first one fails
-            if summary is None:
-                for fallback_model in FREE_MODELS[1:]:
-                    print(f"  Trying fallback model: {fallback_model}")
-                    summary = generate_summary(bill, api_key, fallback_model)
-                    if summary:
-                        break
-
-        if summary:
-            # Find and update the bill in the main list
-            for b in bills:
-                if b.get("bill_id") == bill.get("bill_id"):
-                    b["ai_summary"] = summary
-                    break
-            summaries_generated += 1
-            print(f"  Generated summary ({len(summary)} chars)")
-        else:
-            errors += 1
-            print(f"  Failed to generate summary")
-
-        # Rate limiting (skip in test mode)
-        if not test_mode and i < len(bills_needing_summary) - 1:
-            time.sleep(RATE_LIMIT_DELAY)
-
-    # Save updated bills
-    with open(bills_file, 'w', encoding='utf-8') as f:
-        json.dump(bills, f, indent=2, ensure_ascii=False)
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {
+            executor.submit(summarize_bill, bill, api_key, test_mode, not refresh_cache): bill
+            for bill in bills_needing_summary
+        }
+
+        for i, future in enumerate(as_completed(futures)):
+            bill = futures[future]
+            bill_number = bill.get("bill_number", "Unknown")
+            print(f"[{i+1}/{len(bills_needing_summary)}] Processed {bill_number}")
+
+            try:
+                summary = future.result()
+            except Exception as e:
+                print(f"  Unexpected error: {e}")
+                summary = None
+
+            if summary:
+                # Update the bill in the main list
+                bills_by_id[bill.get("bill_id")]["ai_summary"] = summary
+                summaries_generated += 1
+                print(f"  Generated summary ({len(summary)} chars)")
+
+                # Checkpoint so a crash or Ctrl-C loses at most a few summaries
+                if summaries_generated % CHECKPOINT_EVERY == 0:
+                    save_bills(bills, bills_file)
+            else:
+                errors += 1
+                print(f"  Failed to generate summary")
+    finally:
+        # On an interrupt or unexpected error, skip bills not started yet;
+        # either way, save every summary generated so far
+        executor.shutdown(cancel_futures=True)
+        save_bills(bills, bills_file)
 
     print(f"\nSummary Generation Complete:")
+    print(f"  From cache: {from_cache}")
     print(f"  Generated: {summaries_generated}")
     print(f"  Errors: {errors}")
     print(f"  Updated: {bills_file}")
@@ -279,10 +445,15 @@ def main():
         type=int,
         help="Maximum number of bills to process"
     )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached summaries and call the API again"
+    )
 
     args = parser.parse_args()
 
-    return process_bills(test_mode=args.test, limit=args.limit)
+    return process_bills(test_mode=args.test, limit=args.limit, refresh_cache=args.refresh_cache)
 
 
 if __name__ == "__main__":
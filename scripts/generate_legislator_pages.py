@@ -11,13 +11,17 @@ ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
 LEGISLATORS_DIR = ROOT_DIR / "_legislators"
 
+SLUG_STRIP_RE = re.compile(r'[^a-z0-9\s-]')
+SLUG_SPACE_RE = re.compile(r'[\s_]+')
+SLUG_DASH_RE = re.compile(r'-+')
+
 
 def slugify(name: str) -> str:
     """Convert name to URL-safe slug."""
     slug = name.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = SLUG_STRIP_RE.sub('', slug)
+    slug = SLUG_SPACE_RE.sub('-', slug)
+    slug = SLUG_DASH_RE.sub('-', slug)
     return slug.strip('-')
 
 
@@ -99,8 +103,7 @@ permalink: /legislators/{slug}/
 
         # Write file
         filepath = LEGISLATORS_DIR / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath.write_text(content, encoding='utf-8')
 
         count += 1
 
@@ -24,12 +24,18 @@ ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
 BILLS_DIR = ROOT_DIR / "_bills"
 
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# Leading characters that make a plain YAML scalar ambiguous
+YAML_INDICATORS = ('-', '*', '&', '!', '|', '>', "'", '"', '%', '@', '`')
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = SLUG_STRIP_RE.sub('', text)
+    text = SLUG_DASH_RE.sub('-', text)
     return text.strip('-')
 
 
@@ -48,14 +54,14 @@ def escape_yaml(value: str) -> str:
         return '""'
 
     # Check if the value needs quoting
-    needs_quotes = any([
-        ':' in value,
-        '#' in value,
-        value.startswith(('-', '*', '&', '!', '|', '>', "'", '"', '%', '@', '`')),
-        value.startswith('  '),
-        value.endswith('  '),
-        '\n' in value,
-    ])
+    needs_quotes = (
+        ':' in value
+        or '#' in value
+        or value.startswith(YAML_INDICATORS)
+        or value.startswith('  ')
+        or value.endswith('  ')
+        or '\n' in value
+    )
 
     if needs_quotes:
         # Escape double quotes and wrap in quotes
@@ -176,6 +182,7 @@ def generate_all_pages():
     # Track existing files for cleanup
     existing_files = set(BILLS_DIR.glob("*.md"))
     generated_files = set()
+    written = 0
 
     # Generate pages
     for bill in bills:
@@ -193,13 +200,16 @@ def generate_all_pages():
         # Generate content
         content = generate_bill_page(bill, featured_data)
 
-        # Write file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
+        # Only rewrite pages whose content changed, so unchanged bills keep
+        # their mtime and don't show up in the commit
         generated_files.add(filepath)
+        if filepath in existing_files and filepath.read_text(encoding='utf-8') == content:
+            continue
+
+        filepath.write_text(content, encoding='utf-8')
+        written += 1
 
-    print(f"\nGenerated {len(generated_files)} bill pages in _bills/")
+    print(f"\nGenerated {len(generated_files)} bill pages in _bills/ ({written} written, {len(generated_files) - written} unchanged)")
 
     # Remove old files that are no longer needed
     stale_files = existing_files - generated_files
@@ -18,15 +18,16 @@ STAGES = [
     {'id': 'signed', 'name': 'Signed into Law', 'patterns': ['signed', 'enacted', 'chapter']},
 ]
 
-DEAD_PATTERNS = ['dead', 'failed', 'vetoed', 'indefinitely postponed']
+DEAD_PATTERNS = ('dead', 'failed', 'vetoed', 'indefinitely postponed')
+
+# (stage id, patterns) checked furthest stage first, flattened once so
+# get_stage doesn't walk the STAGES dicts for every bill
+STAGE_PATTERNS = tuple((stage['id'], tuple(stage['patterns'])) for stage in reversed(STAGES))
 
 
 def get_stage(bill: dict) -> str:
     """Determine which pipeline stage a bill is in."""
-    status = (bill.get('status') or '').lower()
-    last_action = (bill.get('last_action') or '').lower()
-
-    combined = status + ' ' + last_action
+    combined = f"{bill.get('status') or ''} {bill.get('last_action') or ''}".lower()
 
     # Check for dead bills first
     for pattern in DEAD_PATTERNS:
@@ -34,10 +35,10 @@ def get_stage(bill: dict) -> str:
             return 'dead'
 
     # Check stages in reverse order (furthest along first)
-    for stage in reversed(STAGES):
-        for pattern in stage['patterns']:
+    for stage_id, patterns in STAGE_PATTERNS:
+        for pattern in patterns:
             if pattern in combined:
-                return stage['id']
+                return stage_id
 
     return 'introduced'  # Default
 
@@ -5,13 +5,15 @@ Creates a JSON file with daily bill activity counts.
 """
 
 import json
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import date, timedelta
+from collections import Counter
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.parent
 DATA_DIR = ROOT_DIR / "_data"
 
+COUNT_KEYS = ('total', 'critical', 'high', 'moderate', 'low', 'beneficial')
+
 
 def generate_timeline():
     """Generate daily activity counts from bill data."""
@@ -24,57 +26,42 @@ def generate_timeline():
     with open(bills_file, 'r', encoding='utf-8') as f:
         bills = json.load(f)
 
-    # Count bills by last_action_date
-    activity_by_date = defaultdict(lambda: {
-        'total': 0,
-        'critical': 0,
-        'high': 0,
-        'moderate': 0,
-        'low': 0,
-        'beneficial': 0
-    })
+    # Count bills by last_action_date, one Counter per count key
+    activity = {key: Counter() for key in COUNT_KEYS}
+    totals = activity['total']
 
     for bill in bills:
-        date = bill.get('last_action_date', '')
-        if not date:
+        action_date = bill.get('last_action_date', '')
+        if not action_date:
             continue
 
-        activity_by_date[date]['total'] += 1
+        totals[action_date] += 1
         threat = bill.get('threat_level', 'moderate')
-        if threat in activity_by_date[date]:
-            activity_by_date[date][threat] += 1
+        if threat in activity:
+            activity[threat][action_date] += 1
 
     # Get date range
-    dates = sorted(activity_by_date.keys())
+    dates = sorted(totals)
     if not dates:
         print("No dates found")
         return 1
 
-    start_date = datetime.strptime(dates[0], '%Y-%m-%d')
-    end_date = datetime.strptime(dates[-1], '%Y-%m-%d')
+    start_date = date.fromisoformat(dates[0])
+    end_date = date.fromisoformat(dates[-1])
 
     # Fill in missing dates with zeros
     timeline = []
     current = start_date
-    cumulative = {
-        'total': 0,
-        'critical': 0,
-        'high': 0,
-        'moderate': 0,
-        'low': 0,
-        'beneficial': 0
-    }
+    one_day = timedelta(days=1)
+    cumulative = dict.fromkeys(COUNT_KEYS, 0)
 
     while current <= end_date:
-        date_str = current.strftime('%Y-%m-%d')
-        day_data = activity_by_date.get(date_str, {
-            'total': 0, 'critical': 0, 'high': 0,
-            'moderate': 0, 'low': 0, 'beneficial': 0
-        })
+        date_str = current.isoformat()
+        day_data = {key: counts[date_str] for key, counts in activity.items()}
 
         # Update cumulative totals
-        for key in cumulative:
-            cumulative[key] += day_data.get(key, 0)
+        for key in COUNT_KEYS:
+            cumulative[key] += day_data[key]
 
         timeline.append({
             'date': date_str,
@@ -88,7 +75,7 @@ def generate_timeline():
             'cumulative_threats': cumulative['critical'] + cumulative['high']
         })
 
-        current += timedelta(days=1)
+        current += one_day
 
     # Save timeline data
     timeline_file = DATA_DIR / "timeline.json"
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Shared request pacing for the scripts that call rate-limited APIs.
+
+Create one RateLimiter per API and call wait() before every request. It is
+thread-safe, so worker threads sharing a limiter overlap request latency
+without ever starting requests closer together than the limiter's delay.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Hands out request slots at least `delay` seconds apart."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is free."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller off for at least `seconds` (e.g. a Retry-After)."""
+        with self._lock:
+            self._next_request_time = max(self._next_request_time, time.monotonic() + seconds)
+
+    def back_off(self, max_delay: float, seconds: float = 0) -> None:
+        """Double the delay (up to max_delay) and pause for `seconds`."""
+        with self._lock:
+            self.delay = min(max_delay, self.delay * 2)
+            self._next_request_time = max(self._next_request_time, time.monotonic() + seconds)
+
+    def recover(self, step: float, min_delay: float) -> None:
+        """Shrink the delay by `step` after a backoff, never below min_delay."""
+        with self._lock:
+            self.delay = max(min_delay, self.delay - step)
@@ -26,7 +26,10 @@ Usage:
 """
 
 import json
+import os
 import re
+from bisect import bisect_right
+from collections import Counter
 from pathlib import Path
 
 # Paths
@@ -116,18 +119,104 @@ GREEN_FLAGS = {
     r'\b(firearm|gun).{0,20}(right|freedom|protect)': -2,
 }
 
+# Minimum score for each threat level above "beneficial", lowest first
+THREAT_THRESHOLDS = (-2, 1, 3, 6)
+THREAT_LEVELS = (
+    ("beneficial", "Potentially Beneficial"),
+    ("low", "Low Concern"),
+    ("moderate", "Moderate Concern"),
+    ("high", "High Threat"),
+    ("critical", "Critical Threat"),
+)
+
+
+def flag_label(pattern: str) -> str:
+    """Short human-readable label for a flag pattern (its first keyword group)."""
+    return pattern.split(r'\b')[1] if r'\b' in pattern else pattern[:30]
+
+
+# Run of literal characters at the start of a regex alternative
+LITERAL_PREFIX_RE = re.compile(r'[^.()\[\]{}\\|^$?*+]*')
+
+
+def leading_keywords(pattern: str) -> tuple | None:
+    """
+    Literal prefixes of the alternatives in a pattern's leading \\b(...) group.
+
+    Every match of the pattern starts with one of these, so text containing
+    none of them can't match. Returns None when a prefix can't be derived.
+    """
+    if not pattern.startswith(r'\b('):
+        return None
+
+    # Split the leading group on its top-level '|'
+    alternatives = []
+    depth = 0
+    start = i = len(r'\b(')
+    while depth >= 0:
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if depth < 0 or (char == '|' and depth == 0):
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+
+    keywords = []
+    for alternative in alternatives:
+        literal = LITERAL_PREFIX_RE.match(alternative).group()
+        # A quantifier applies to the character before it ('powers?')
+        if alternative[len(literal):len(literal) + 1] in ('?', '*', '+', '{'):
+            literal = literal[:-1]
+        if not literal:
+            return None
+        keywords.append(literal)
+    return tuple(keywords)
+
+
+def compile_flags(flags: dict) -> tuple:
+    """Compile flag patterns once into (search, weight, label, keywords) tuples."""
+    return tuple(
+        (re.compile(pattern, re.IGNORECASE).search, weight, flag_label(pattern),
+         leading_keywords(pattern))
+        for pattern, weight in flags.items()
+    )
+
+
+RED_PATTERNS = compile_flags(RED_FLAGS)
+ORANGE_PATTERNS = compile_flags(ORANGE_FLAGS)
+GREEN_PATTERNS = compile_flags(GREEN_FLAGS)
+
+
+def matching_flags(patterns: tuple, text: str):
+    """Yield (weight, label) for each compiled flag that matches the text."""
+    # Plain substring checks rule out most flags before running the regex.
+    # Only trusted on ASCII text: IGNORECASE also folds a few non-ASCII
+    # letters that lower() leaves alone (e.g. 'ſ' matches 's')
+    prefilter = text.isascii()
+    for search, weight, label, keywords in patterns:
+        if prefilter and keywords and not any(keyword in text for keyword in keywords):
+            continue
+        if search(text):
+            yield weight, label
+
 
 def score_bill(bill: dict) -> dict:
     """
     Score a bill based on its title and description.
     Returns the bill dict with added scoring fields.
     """
-    title = (bill.get("title") or "").lower()
-    description = (bill.get("description") or "").lower()
-    last_action = (bill.get("last_action") or "").lower()
+    title = bill.get("title") or ""
+    description = bill.get("description") or ""
+    last_action = bill.get("last_action") or ""
 
-    # Combine text for analysis
-    text = f"{title} {description} {last_action}"
+    # Combine text for analysis, lowercased once
+    text = f"{title} {description} {last_action}".lower()
 
     # Start with baseline score (skeptical - assume slight harm)
     score = 1  # Default slight negative (yellow)
@@ -136,40 +225,23 @@ def score_bill(bill: dict) -> dict:
     matched_positives = []
 
     # Check red flags (most harmful)
-    for pattern, weight in RED_FLAGS.items():
-        if re.search(pattern, text, re.IGNORECASE):
-            score += weight
-            matched_concerns.append(pattern.split(r'\b')[1] if r'\b' in pattern else pattern[:30])
+    for weight, label in matching_flags(RED_PATTERNS, text):
+        score += weight
+        matched_concerns.append(label)
 
     # Check orange flags (moderate harm)
-    for pattern, weight in ORANGE_FLAGS.items():
-        if re.search(pattern, text, re.IGNORECASE):
-            score += weight
-            if weight > 0:
-                matched_concerns.append(pattern.split(r'\b')[1] if r'\b' in pattern else pattern[:30])
+    for weight, label in matching_flags(ORANGE_PATTERNS, text):
+        score += weight
+        if weight > 0:
+            matched_concerns.append(label)
 
     # Check green flags (beneficial)
-    for pattern, weight in GREEN_FLAGS.items():
-        if re.search(pattern, text, re.IGNORECASE):
-            score += weight  # weight is negative, so this reduces score
-            matched_positives.append(pattern.split(r'\b')[1] if r'\b' in pattern else pattern[:30])
+    for weight, label in matching_flags(GREEN_PATTERNS, text):
+        score += weight  # weight is negative, so this reduces score
+        matched_positives.append(label)
 
     # Determine threat level
-    if score >= 6:
-        threat_level = "critical"
-        threat_label = "Critical Threat"
-    elif score >= 3:
-        threat_level = "high"
-        threat_label = "High Threat"
-    elif score >= 1:
-        threat_level = "moderate"
-        threat_label = "Moderate Concern"
-    elif score >= -2:
-        threat_level = "low"
-        threat_label = "Low Concern"
-    else:
-        threat_level = "beneficial"
-        threat_label = "Potentially Beneficial"
+    threat_level, threat_label = THREAT_LEVELS[bisect_right(THREAT_THRESHOLDS, score)]
 
     # If we have no text to analyze, mark as unknown
     if not title and not description:
@@ -182,11 +254,12 @@ def score_bill(bill: dict) -> dict:
     bill["threat_level"] = threat_level
     bill["threat_label"] = threat_label
 
-    # Add brief concern summary (top 3)
+    # Add brief concern summary (first 3 distinct matches, in rule order so
+    # the output doesn't depend on string hash seeding between runs)
     if matched_concerns:
-        bill["concerns"] = list(set(matched_concerns))[:3]
+        bill["concerns"] = list(dict.fromkeys(matched_concerns))[:3]
     if matched_positives:
-        bill["positives"] = list(set(matched_positives))[:3]
+        bill["positives"] = list(dict.fromkeys(matched_positives))[:3]
 
     return bill
 
@@ -205,22 +278,15 @@ def score_all_bills():
     print(f"Scoring {len(bills)} bills...")
 
     # Score each bill
-    threat_counts = {
-        "critical": 0,
-        "high": 0,
-        "moderate": 0,
-        "low": 0,
-        "beneficial": 0,
-        "unknown": 0
-    }
-
-    for bill in bills:
-        score_bill(bill)
-        threat_counts[bill["threat_level"]] += 1
-
-    # Save scored bills
-    with open(bills_file, 'w', encoding='utf-8') as f:
+    threat_counts = Counter(score_bill(bill)["threat_level"] for bill in bills)
+
+    # Save scored bills. json.dump already streams to the file; writing to
+    # a temp file and renaming means an interrupted run can't leave a
+    # truncated bills.json behind
+    tmp_file = bills_file.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         json.dump(bills, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, bills_file)
 
     print("\nThreat Level Distribution:")
     print(f"  🔴 Critical:   {threat_counts['critical']:4d} bills")
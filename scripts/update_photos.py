@@ -157,6 +157,12 @@ LEGISLATOR_IDS = {
     "Janice Zahn": 35736,
 }
 
+# Official thumbnail URL for each legislator in LEGISLATOR_IDS
+PHOTO_URLS = {
+    name: f"https://leg.wa.gov/memberthumbnail/{leg_id}.jpg"
+    for name, leg_id in LEGISLATOR_IDS.items()
+}
+
 def update_photos():
     """Update legislator photos in the JSON file."""
     with open('_data/legislators.json', 'r') as f:
@@ -167,9 +173,9 @@ def update_photos():
 
     for leg in legislators:
         name = leg.get('name', '')
-        if name in LEGISLATOR_IDS:
-            leg_id = LEGISLATOR_IDS[name]
-            leg['photo_url'] = f"https://leg.wa.gov/memberthumbnail/{leg_id}.jpg"
+        photo_url = PHOTO_URLS.get(name)
+        if photo_url is not None:
+            leg['photo_url'] = photo_url
             updated_count += 1
         else:
             not_found.append(name)